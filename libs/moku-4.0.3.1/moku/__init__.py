@@ -204,7 +204,7 @@ class Moku:
                 local_chksum = bs_manifest["items"][0]["sha256"]
                 if not (rmt_chksum and local_chksum == rmt_chksum):
                     logger.info(f"Uploading bitstream {bs_name} (checksum mismatch or missing)")
-                    self.upload("bitstreams", bs_name, open(bs_file_name, "rb").read())
+                    self.upload("bitstreams", bs_name, bs_file_name)
                 else:
                     logger.debug(f"Bitstream {bs_name} already up to date")
 
@@ -471,8 +471,8 @@ class Moku:
         :type file_name: `string`
         :param file_name: Name of the file to be uploaded
 
-        :type data: `bytes`
-        :param data: File content
+        :type data: `bytes` or `os.PathLike`
+        :param data: File content, or the path of a local file to upload
 
         """
         operation = f"upload/{file_name}"
@@ -25,7 +25,7 @@ MokuInfo = namedtuple(
 
 
 class Finder(object):
-    def __init__(self, on_add=None, on_remove=None):
+    def __init__(self, on_add=None, on_remove=None, on_update=None):
         self.moku_list = []
         self.finished = False
         self.filter = None
@@ -34,6 +34,7 @@ class Finder(object):
         self.browser = None
         self.on_add = on_add
         self.on_remove = on_remove
+        self.on_update = on_update
 
     @staticmethod
     def _get_parsed_addresses(info):
@@ -90,19 +91,25 @@ class Finder(object):
             ipv6_addr=addresses[1],
         )
 
-    def add_service(self, zeroconf, service_type, name):
+    def _get_record(self, zeroconf, service_type, name):
         info = zeroconf.get_service_info(service_type, name)
         if info is None:
-            return
+            return None
 
         try:
             parsers = {0.2: self._parse_02, 0.4: self._parse_04, 0.5: self._parse_05}
             record = parsers[float(info.properties[b"txtver"])](info)
         except Exception as e:
             log.error(e)
-            return
+            return None
 
         if self.filter is None or self.filter(record):
+            return record
+        return None
+
+    def add_service(self, zeroconf, service_type, name):
+        record = self._get_record(zeroconf, service_type, name)
+        if record is not None:
             self.moku_list.append(record)
 
             if self.on_add:
@@ -113,7 +120,11 @@ class Finder(object):
             self.on_remove(name)
 
     def update_service(self, zeroconf, service_type, name):
-        pass
+        # e.g. the Moku got a new address from DHCP
+        if self.on_update:
+            record = self._get_record(zeroconf, service_type, name)
+            if record is not None:
+                self.on_update(name, record)
 
     def start(self):
         self.browser = ServiceBrowser(
@@ -14,11 +14,30 @@ import logging
 from typing import Any, Optional, List, Tuple
 from copy import copy, deepcopy
 
+try:
+    # optional, faster encoder for .linn export
+    import orjson
+except ImportError:
+    orjson = None
+
 # list of supported activations
 _AVAILABLE_ACTIVATIONS = ["relu", "tanh", "sigmoid", "softsign", "linear"]
+_AVAILABLE_ACTIVATIONS_SET = frozenset(_AVAILABLE_ACTIVATIONS)
 _LOG = logging.getLogger("Linn")
 
 
+def _affine_coefficients(lower: np.ndarray, upper: np.ndarray):
+    """
+    Fold the mapping of [lower, upper] onto [-1, 1] into a single multiply-add.
+    :param lower: Lower bound of the data
+    :param upper: Upper bound of the data
+    :return: Tuple of (scale, bias) such that transformed = data * scale + bias
+    """
+    scale = 2.0 / (upper - lower)
+    bias = -(upper + lower) / (upper - lower)
+    return scale, bias
+
+
 def list_activations():
     """
     List the available activation functions
@@ -29,13 +48,17 @@ def list_activations():
 
 class WeightClip(keras.constraints.Constraint):
 
-    def __init__(self, clip_value: float = 1.0) -> None:
+    def __init__(self, clip_value: Any = 1.0) -> None:
         """
         Clips all the weights/biases to be within the range [-1, 1] to help with quantization later on.
-        :param clip_value: value to clip the model between (float).
+        :param clip_value: value to clip the model between (float), or a sequence with one value per output
+        channel to clip each channel to its own symmetric range.
         """
         super().__init__()
-        self.clip_value = float(clip_value)
+        if np.ndim(clip_value) == 0:
+            self.clip_value = float(clip_value)
+        else:
+            self.clip_value = [float(value) for value in clip_value]
 
     def __call__(self, w: Any):
         """
@@ -43,7 +66,9 @@ class WeightClip(keras.constraints.Constraint):
         :param w: Tensor or variable representing the weights
         :return: Tensor or variable clipped to the bounds
         """
-        return tf.clip_by_value(w, -self.clip_value, self.clip_value)
+        # per-channel bounds broadcast along the last (output) axis of kernels and biases
+        clip_value = tf.cast(self.clip_value, w.dtype)
+        return tf.clip_by_value(w, -clip_value, clip_value)
 
     def get_config(self):
         return {"name": self.__class__.__name__, "clip_value": self.clip_value}
@@ -74,12 +99,63 @@ class LinnModel:
         self.model = None
         self.training_inputs = None
         self.training_outputs = None
+        self._in_dim = None
+        self._out_dim = None
 
         self._input_transform_args = None
         self._output_transform_args = None
+        self._input_affine = None
+        self._output_affine = None
+        self._predict_buffer = None
 
         self.model_definition = None
 
+    @staticmethod
+    def _validate_layer_definition(layer_definition: list) -> List[Tuple[int, str]]:
+        """
+        Validate a layer definition and parse it into layer widths and activations.
+        :param layer_definition: a list of tuples of the form `(layer_width, activation)`
+        :return: List of `(layer_width, activation)` tuples with the width as int and activation as str
+        """
+        if layer_definition is None:
+            raise ValueError("layer_definition can't be empty.")
+        if not isinstance(layer_definition, list):
+            raise TypeError(
+                f"Expected type:<list> for model definition. Received: <{type(layer_definition)}>."
+            )
+        if len(layer_definition) == 0:
+            raise ValueError("layer_definition can't be empty.")
+
+        parsed_definition = []
+        for idx, layer_defn in enumerate(layer_definition):
+            if not isinstance(layer_defn, tuple):
+                raise TypeError(
+                    f"layer_definition index:{idx} is type:<{type(layer_defn)} not <tuple>."
+                )
+
+            if len(layer_defn) != 2:
+                raise ValueError(
+                    f"layer_definition index:{idx} should have length 2, not {len(layer_defn)}."
+                )
+
+            width, activation = layer_defn
+            # grab the layer width
+            try:
+                layer_width = int(width)
+            except ValueError as e:
+                raise ValueError(f"Error converting the layer width: {e.args}.")
+            parsed_definition.append((layer_width, str(activation)))
+
+        unsupported = {act for _, act in parsed_definition} - _AVAILABLE_ACTIVATIONS_SET
+        if unsupported:
+            activation = next(act for _, act in parsed_definition if act in unsupported)
+            raise ValueError(
+                f"Activation {activation} is not in the list of supported activations. "
+                f"Try {list_activations()}."
+            )
+
+        return parsed_definition
+
     def construct_model(
         self,
         layer_definition: list = None,
@@ -104,50 +180,16 @@ class LinnModel:
         if self.training_inputs is None or self.training_outputs is None:
             raise TypeError("Please set the training data first.")
 
-        # check the model definition type
-        if layer_definition is not None:
-            if type(layer_definition) is not list:
-                raise TypeError(
-                    f"Expected type:<list> for model definition. Received: <{type(layer_definition)}>."
-                )
-            elif len(layer_definition) == 0:
-                raise ValueError("layer_definition can't be empty.")
-        else:
-            raise ValueError("layer_definition can't be empty.")
+        # check the model definition, all errors are raised before building any layers
+        parsed_definition = self._validate_layer_definition(layer_definition)
 
         # assign the definition for checking
         self.model_definition = layer_definition
 
         # construct the model
-        input_layer = keras.layers.Input((self.training_inputs.shape[-1],))
+        input_layer = keras.layers.Input((self._in_dim,))
         prev_layer = input_layer
-        # prev_layer = None
-        for idx, layer_defn in enumerate(layer_definition):
-            if type(layer_defn) is not tuple:
-                raise TypeError(
-                    f"layer_definition index:{idx} is type:<{type(layer_defn)} not <tuple>."
-                )
-
-            if len(layer_defn) != 2:
-                raise ValueError(
-                    f"layer_definition index:{idx} should have length 2, not {len(layer_defn)}."
-                )
-
-            # grab the activation function
-            # activation = 'linear'
-
-            activation = str(layer_defn[1])
-            if activation not in list_activations():
-                raise ValueError(
-                    f"Activation {activation} is not in the list of supported activations. "
-                    f"Try {list_activations()}."
-                )
-            # grab the layer width
-            try:
-                layer_width = int(layer_defn[0])
-            except ValueError as e:
-                raise ValueError(f"Error converting the layer width: {e.args}.")
-
+        for layer_width, activation in parsed_definition:
             prev_layer = keras.layers.Dense(
                 layer_width,
                 activation=activation,
@@ -158,9 +200,9 @@ class LinnModel:
 
         # compile the model for training
         self.model = keras.Model(input_layer, prev_layer)
-        self.model.compile(
-            optimizer=optimizer, loss=loss, metrics=[met for met in metrics]
-        )
+        if not isinstance(metrics, list):
+            metrics = list(metrics)
+        self.model.compile(optimizer=optimizer, loss=loss, metrics=metrics)
 
         # summarize if necessary
         if show_summary:
@@ -169,7 +211,7 @@ class LinnModel:
 
     def _check_model_definition(self):
         # Check the input_layer first
-        if type(self.model_definition[0]) is not tuple:
+        if not isinstance(self.model_definition[0], tuple):
             _LOG.warning(
                 f"Definition of input_layer is type:<{type(self.model_definition[0])} not <tuple>."
             )
@@ -182,17 +224,17 @@ class LinnModel:
         if len(self.model_definition[0]) == 2:
             _LOG.warning(f"Ignored the activation function in the input_layer")
 
-        if self.model_definition[0][0] != self.training_inputs.shape[-1]:
+        if self.model_definition[0][0] != self._in_dim:
             _LOG.warning(
                 f"Shape of layer_definition index: 0 not match the shape of input data, should be "
-                f"{self.training_inputs.shape[-1]}, not {self.model_definition[0][0]}. Changed to the shape of"
+                f"{self._in_dim}, not {self.model_definition[0][0]}. Changed to the shape of"
                 f" input data automatically."
             )
 
-        self.model_definition[0] = (self.training_inputs.shape[-1],)
+        self.model_definition[0] = (self._in_dim,)
 
         for idx, layer_defn in enumerate(self.model_definition[1:]):
-            if type(layer_defn) is not tuple:
+            if not isinstance(layer_defn, tuple):
                 raise TypeError(
                     f"layer_definition index:{idx+1} is type:<{type(layer_defn)} not <tuple>."
                 )
@@ -203,25 +245,25 @@ class LinnModel:
                 )
 
             if len(layer_defn) == 2:
-                if layer_defn[1] not in list_activations():
+                if layer_defn[1] not in _AVAILABLE_ACTIVATIONS_SET:
                     raise ValueError(
                         f"Activation {layer_defn[1]} is not in the list of supported activations. "
                         f"Try {list_activations()}."
                     )
 
-        if self.model_definition[-1][0] != self.training_outputs.shape[-1]:
+        if self.model_definition[-1][0] != self._out_dim:
             _LOG.warning(
                 f"Shape of layer_definition index: {len(self.model_definition)-1} does not match the shape of "
-                f"output data, should be {self.training_outputs.shape[1:]}, not "
+                f"output data, should be {self._out_dim}, not "
                 f"{self.model_definition[-1][0]}. Changed to the shape of output data automatically"
             )
             if len(self.model_definition[-1]) == 2:
                 self.model_definition[-1] = (
-                    self.training_outputs.shape[-1],
+                    self._out_dim,
                     self.model_definition[-1][1],
                 )
             else:
-                self.model_definition[-1] = (self.training_outputs.shape[-1],)
+                self.model_definition[-1] = (self._out_dim,)
 
         return True
 
@@ -271,32 +313,32 @@ class LinnModel:
         :param is_input: is it an input or output?
         :return: Return the transformed array
         """
-        # copy the array so we don't modify the original
-        output_array = np.copy(data_array)
-        # get the scales if they are missing
-        if is_input and self._input_transform_args is None:
-            self._input_transform_args = (
-                np.min(output_array, axis=0),
-                np.max(output_array, axis=0),
-            )
-        if not is_input and self._output_transform_args is None:
-            self._output_transform_args = (
-                np.min(output_array, axis=0),
-                np.max(output_array, axis=0),
-            )
+        # write into a new array so we don't modify the original
+        data_array = np.asarray(data_array)
+        output_array = np.empty(
+            data_array.shape, dtype=np.result_type(data_array.dtype, np.float32)
+        )
+        return self._transform_into(data_array, output_array, is_input)
 
-        # scale everything according to the transform arguments
-        if is_input:
-            output_array -= self._input_transform_args[0]
-            output_array /= (
-                self._input_transform_args[1] - self._input_transform_args[0]
-            )
-        else:
-            output_array -= self._output_transform_args[0]
-            output_array /= (
-                self._output_transform_args[1] - self._output_transform_args[0]
+    def _transform_into(
+        self, data_array: np.ndarray, output_array: np.ndarray, is_input: bool
+    ):
+        """
+        Transform the data into a domain amenable for quantization, writing into a preallocated array.
+        :param data_array: Data array to be transformed
+        :param output_array: Array of the same shape as data_array that receives the result
+        :param is_input: is it an input or output?
+        :return: Return output_array
+        """
+        # scale everything according to the coefficients fixed in set_training_data
+        affine = self._input_affine if is_input else self._output_affine
+        if affine is None:
+            raise RuntimeError(
+                "Cannot transform before the scaling is set by set_training_data."
             )
-        output_array = 2 * (output_array - 0.5)
+        scale, bias = affine
+        np.multiply(data_array, scale, out=output_array)
+        output_array += bias
 
         return output_array
 
@@ -307,8 +349,6 @@ class LinnModel:
         :param is_input: is it the input or output
         :return: Return the transformed array
         """
-        # copy the array so we don't destroy the original
-        output_array = np.copy(data_array)
         # see if things can be transformed
         if is_input and self._input_transform_args is None:
             raise RuntimeError(
@@ -319,19 +359,13 @@ class LinnModel:
                 "Cannot inverse transform before first calling transform."
             )
 
-        # perform the inverse scaling
-        output_array /= 2.0
-        output_array += 0.5
+        # perform the inverse scaling, the arithmetic allocates the output so the original is kept
         if is_input:
-            output_array *= (
-                self._input_transform_args[1] - self._input_transform_args[0]
-            )
-            output_array += self._input_transform_args[0]
+            lower, upper = self._input_transform_args
         else:
-            output_array *= (
-                self._output_transform_args[1] - self._output_transform_args[0]
-            )
-            output_array += self._output_transform_args[0]
+            lower, upper = self._output_transform_args
+        output_array = np.multiply(data_array, (upper - lower) / 2.0)
+        output_array += (upper + lower) / 2.0
 
         return output_array
 
@@ -359,6 +393,8 @@ class LinnModel:
         # want to revisit and e.g. only copy if we're scaling
         training_inputs = np.array(copy(training_inputs), dtype=float)
         training_outputs = np.array(copy(training_outputs), dtype=float)
+        in_dim = training_inputs.shape[-1]
+        out_dim = training_outputs.shape[-1]
 
         if not scale and (
             input_data_boundary is not None or output_data_boundary is not None
@@ -385,15 +421,15 @@ class LinnModel:
                         f"Upper bounds should be type:<numpy.ndarray> or type:<list> not {type(input_data_boundary[1])}."
                     )
 
-                if len(input_data_boundary[0]) != training_inputs.shape[-1]:
+                if len(input_data_boundary[0]) != in_dim:
                     raise ValueError(
                         f"Dimensions of lower bounds do not match input: {len(input_data_boundary[0])}, "
-                        f"{training_inputs.shape[-1]}"
+                        f"{in_dim}"
                     )
-                if len(input_data_boundary[1]) != training_inputs.shape[-1]:
+                if len(input_data_boundary[1]) != in_dim:
                     raise ValueError(
                         f"Dimensions of upper bounds do not match input: {len(input_data_boundary[1])}, "
-                        f"{training_inputs.shape[-1]}"
+                        f"{in_dim}"
                     )
 
             if output_data_boundary is not None:
@@ -415,25 +451,42 @@ class LinnModel:
                         f"Upper bounds should be type:<numpy.ndarray> or type:<list> not {type(output_data_boundary[1])}."
                     )
 
-                if len(output_data_boundary[0]) != training_outputs.shape[-1]:
+                if len(output_data_boundary[0]) != out_dim:
                     raise ValueError(
                         f"Dimensions of lower bounds do not match outputs: {len(input_data_boundary[0])}, "
-                        f"{training_outputs.shape[-1]}"
+                        f"{out_dim}"
                     )
-                if len(output_data_boundary[1]) != training_outputs.shape[-1]:
+                if len(output_data_boundary[1]) != out_dim:
                     raise ValueError(
                         f"Dimensions of upper bounds do not match outputs: {len(output_data_boundary[1])}, "
-                        f"{training_outputs.shape[-1]}"
+                        f"{out_dim}"
                     )
 
         if input_data_boundary is not None:
-            self._input_transform_args = [
+            self._input_transform_args = tuple(
                 np.array(boundary) for boundary in input_data_boundary
-            ]
+            )
         if output_data_boundary is not None:
-            self._output_transform_args = [
+            self._output_transform_args = tuple(
                 np.array(boundary) for boundary in output_data_boundary
-            ]
+            )
+
+        # measure the data range when no boundary is known and fix the scaling coefficients
+        if scale:
+            if self._input_transform_args is None:
+                self._input_transform_args = (
+                    np.min(training_inputs, axis=0),
+                    np.max(training_inputs, axis=0),
+                )
+            if self._output_transform_args is None:
+                self._output_transform_args = (
+                    np.min(training_outputs, axis=0),
+                    np.max(training_outputs, axis=0),
+                )
+        if self._input_transform_args is not None:
+            self._input_affine = _affine_coefficients(*self._input_transform_args)
+        if self._output_transform_args is not None:
+            self._output_affine = _affine_coefficients(*self._output_transform_args)
 
         # scale the data if necessary to scale the full dynamic range
         if scale:
@@ -443,6 +496,8 @@ class LinnModel:
         # set the internal variables
         self.training_inputs = training_inputs
         self.training_outputs = training_outputs
+        self._in_dim = in_dim
+        self._out_dim = out_dim
 
     @staticmethod
     def _log_missing_value(key: str, default_value: Any, config: dict):
@@ -460,6 +515,34 @@ class LinnModel:
         else:
             return dict_value
 
+    def _training_dataset(self, batch_size: int, shuffle: bool = True):
+        """
+        Build a batched dataset of the training data that prefetches the next batch while the current one trains.
+        :param batch_size: (int) number of samples per batch
+        :param shuffle: (bool) reshuffle the samples every epoch, as keras does for arrays
+        :return: tf.data.Dataset of (inputs, outputs) batches
+        """
+        if not shuffle:
+            dataset = tf.data.Dataset.from_tensor_slices(
+                (self.training_inputs, self.training_outputs)
+            ).batch(batch_size)
+            return dataset.prefetch(tf.data.AUTOTUNE)
+
+        # like keras' array path, shuffle row indices and gather each batch so the
+        # shuffle buffer holds integers rather than a copy of the training set
+        inputs = tf.convert_to_tensor(self.training_inputs)
+        outputs = tf.convert_to_tensor(self.training_outputs)
+        dataset = (
+            tf.data.Dataset.range(len(self.training_inputs))
+            .shuffle(len(self.training_inputs), reshuffle_each_iteration=True)
+            .batch(batch_size)
+            .map(
+                lambda indices: (tf.gather(inputs, indices), tf.gather(outputs, indices)),
+                num_parallel_calls=tf.data.AUTOTUNE,
+            )
+        )
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
     def fit_model(
         self,
         epochs: int,
@@ -475,7 +558,8 @@ class LinnModel:
         :param es_config: configuration dictionary for the early stopping callback
         :param validation_split: (float) used to define the validation split
         :param validation_data: validation data in a tuple of form (inputs, outputs)
-        :param keras_kwargs: keyword args to pass to the keras `fit` function
+        :param keras_kwargs: keyword args to pass to the keras `fit` function. `batch_size` and `shuffle` are
+        applied to the prefetched training dataset when no validation split is requested.
         :return: history object from the keras `fit` function
         """
 
@@ -557,7 +641,20 @@ class LinnModel:
                 )
 
         # finally fit the model
-        if validation_data is not None:
+        if (
+            validation_data is not None or validation_split == 0.0
+        ) and "sample_weight" not in keras_kwargs:
+            # keras can't split a dataset, so batches are only streamed when no split is requested
+            batch_size = keras_kwargs.pop("batch_size", None) or 32
+            keras_kwargs.setdefault("validation_batch_size", batch_size)
+            history = self.model.fit(
+                self._training_dataset(batch_size, keras_kwargs.pop("shuffle", True)),
+                epochs=epochs,
+                validation_data=validation_data,
+                callbacks=callbacks,
+                **keras_kwargs,
+            )
+        elif validation_data is not None:
             history = self.model.fit(
                 self.training_inputs,
                 self.training_outputs,
@@ -604,7 +701,16 @@ class LinnModel:
             unscale_output = self._output_transform_args is not None
 
         if scale:
-            inputs = self._transform(inputs, True)
+            # reuse the scaled input buffer between calls of the same shape, e.g. streaming inference
+            inputs = np.asarray(inputs)
+            dtype = np.result_type(inputs.dtype, np.float32)
+            if (
+                self._predict_buffer is None
+                or self._predict_buffer.shape != inputs.shape
+                or self._predict_buffer.dtype != dtype
+            ):
+                self._predict_buffer = np.empty(inputs.shape, dtype=dtype)
+            inputs = self._transform_into(inputs, self._predict_buffer, True)
 
         # call the prediction
         outputs = self.model.predict(inputs, **keras_kwargs)
@@ -624,129 +730,170 @@ def _eprint(*args, **kwargs):
 
 custom_objects = {"OutputClipLayer": OutputClipLayer, "WeightClip": WeightClip}
 
+_LINN_ACTIVATIONS = {
+    "relu": lambda x: np.maximum(x, 0.0),
+    "tanh": np.tanh,
+    "sigmoid": lambda x: 1.0 / (1.0 + np.exp(-x)),
+    "softsign": lambda x: x / (1.0 + np.abs(x)),
+    "linear": lambda x: x,
+}
+
+
+def _linn_forward(jlayers: List[dict], inputs: np.ndarray) -> np.ndarray:
+    """
+    Run a batch through the exported layers, clipping each layer output as the hardware does.
+    :param jlayers: Layers in the `.linn` form produced by convert_keras_to_linn
+    :param inputs: Batch of network inputs with shape (batch, input_size)
+    :return: Batch of network outputs
+    :raises ValueError: if a layer uses an activation with no numpy equivalent
+    """
+    outputs = np.asarray(inputs, dtype=float)
+    for jlayer in jlayers:
+        activation = _LINN_ACTIVATIONS.get(jlayer["activation"])
+        if activation is None:
+            raise ValueError(
+                f"Cannot check calibration_inputs: unsupported activation "
+                f"'{jlayer['activation']}'. Supported: {', '.join(_LINN_ACTIVATIONS)}"
+            )
+        # one matrix product per layer covers the whole batch
+        outputs = outputs @ np.asarray(jlayer["weights"]).T + np.asarray(jlayer["biases"])
+        outputs = np.clip(activation(outputs), -1.0, 1.0)
+    return outputs
+
 
 def convert_keras_to_linn(
     model: keras.models.Model, input_channels: int, output_channels: int, **kwargs
 ):
     dims: List[int] = []
-    jlayers: List[dict] = []
 
-    assert isinstance(
-        model, (keras.Sequential, keras.Model, LinnModel)
-    ), f"Unsupported model {type(model)}"
+    if not isinstance(model, (keras.Sequential, keras.Model, LinnModel)):
+        raise AssertionError(f"Unsupported model {type(model)}")
 
     if isinstance(model, LinnModel):
         model = model.model
 
+    skipped_layers = (WeightClip, OutputClipLayer, keras.layers.InputLayer)
+    numLayers = sum(not isinstance(layer, skipped_layers) for layer in model.layers)
+    if numLayers > 5:
+        raise AssertionError("Only five dense layers allowed")
+    jlayers: List[dict] = [None] * numLayers
+
     colDepth = 0
     hardwareLayers = 0
 
     for i, layer in enumerate(model.layers):
-        if isinstance(layer, (WeightClip, OutputClipLayer, keras.layers.InputLayer)):
+        if isinstance(layer, skipped_layers):
             _eprint(f"Skipping layer {i} with type {type(layer)}")
             continue
 
-        if isinstance(layer, keras.layers.InputLayer):
-            assert i == 0, "Input layer must be first layer"
-            inputs = layer.batch_shape[0]
-            dims.append(inputs)
-            _eprint(f"Input shape {inputs}")
-        else:
-
-            assert isinstance(
-                layer, keras.layers.Dense
-            ), f"Only Dense layers supported, got ({type(layer)})"
-
-            layerWeights = layer.get_weights()
-            assert len(layerWeights) == 2, "Layer must only contains weights and biases"
-
-            # layers are stored in column-major order
-            weights = layerWeights[0].transpose()
-            bias = layerWeights[1]
-
-            assert len(weights.shape) == 2, "Only two dimensional layers supported"
-            assert len(bias.shape) == 1, "Biases must be a vector"
-
-            nRows = weights.shape[0]
-            nCols = weights.shape[1]
-            nBias = bias.shape[0]
-
-            assert 0 < nBias <= 100, "Number of output rows must be 100 or fewer"
-            assert nBias == nRows, "Weights output does not match bias vector size"
-            if hardwareLayers == 0:
-                # Handle the input to the network
-                assert 1 <= nCols <= 100, "Maximum network input size is 100"
-                dims.append(nCols)
-            else:
-                assert nCols == dims[-1], (
-                    f"Input size {nCols} does not match output "
-                    f"of previous layer {dims[-1]}"
-                )
-            dims.append(nRows)
-
-            # Ensure that the total number of weights and biases is not too large
-            # to fit into the memory for each neuron.
-            colDepth += nCols + 3  # bias
-            hardwareLayers += 1
-
-            jlayers.append(
-                {
-                    "activation": layer.activation.__name__.lower(),
-                    "weights": weights.tolist(),
-                    "biases": bias.tolist(),
-                }
+        if not isinstance(layer, keras.layers.Dense):
+            raise AssertionError(f"Only Dense layers supported, got ({type(layer)})")
+
+        layerWeights = layer.get_weights()
+        if len(layerWeights) != 2:
+            raise AssertionError("Layer must only contains weights and biases")
+
+        # layers are stored in column-major order
+        weights = layerWeights[0].transpose()
+        bias = layerWeights[1]
+
+        if len(weights.shape) != 2:
+            raise AssertionError("Only two dimensional layers supported")
+        if len(bias.shape) != 1:
+            raise AssertionError("Biases must be a vector")
+
+        nRows = weights.shape[0]
+        nCols = weights.shape[1]
+        nBias = bias.shape[0]
+
+        if not (0 < nBias <= 100):
+            raise AssertionError("Number of output rows must be 100 or fewer")
+        if nBias != nRows:
+            raise AssertionError("Weights output does not match bias vector size")
+        if hardwareLayers == 0:
+            # Handle the input to the network
+            if not (1 <= nCols <= 100):
+                raise AssertionError("Maximum network input size is 100")
+            dims.append(nCols)
+        elif nCols != dims[-1]:
+            raise AssertionError(
+                f"Input size {nCols} does not match output "
+                f"of previous layer {dims[-1]}"
             )
-
-    assert hardwareLayers <= 5, "Only five dense layers allowed"
-
-    assert colDepth <= 1024, (
-        "Total number of weights and biases too large,"
-        "sum(L[0].shape[1] for L in layers) + 3*len(layers)"
-        f" = {colDepth} must be <= 1024"
-    )
+        dims.append(nRows)
+
+        # Ensure that the total number of weights and biases is not too large
+        # to fit into the memory for each neuron.
+        colDepth += nCols + 3  # bias
+
+        jlayers[hardwareLayers] = {
+            "activation": layer.activation.__name__.lower(),
+            "weights": weights.tolist(),
+            "biases": bias.tolist(),
+        }
+        hardwareLayers += 1
+
+    if colDepth > 1024:
+        raise AssertionError(
+            "Total number of weights and biases too large,"
+            "sum(L[0].shape[1] for L in layers) + 3*len(layers)"
+            f" = {colDepth} must be <= 1024"
+        )
 
     _eprint(f"Network latency approx. {colDepth} cycles")
 
+    if "calibration_inputs" in kwargs:
+        calibration_inputs = np.asarray(kwargs.get("calibration_inputs"), dtype=float)
+        expected = model.predict(calibration_inputs, verbose=0)
+        if not np.allclose(_linn_forward(jlayers, calibration_inputs), expected, atol=1e-4):
+            raise AssertionError(
+                "Exported layers do not reproduce the model output for the calibration inputs"
+            )
+
     if "output_mapping" in kwargs:
         output_map = kwargs.get("output_mapping")
         prev_final_weights = deepcopy(jlayers[-1]["weights"])
         prev_final_bias = deepcopy(jlayers[-1]["biases"])
-        assert isinstance(output_map, list), "Output mapping must be a list"
-        assert len(output_map) <= len(prev_final_weights), (
-            f"Output mapping must have less than {len(prev_final_weights)} elements"
-        )
-        assert len(output_map) > 0, "Output mapping must have at least one element"
+        if not isinstance(output_map, list):
+            raise AssertionError("Output mapping must be a list")
+        if len(output_map) > len(prev_final_weights):
+            raise AssertionError(
+                f"Output mapping must have less than {len(prev_final_weights)} elements"
+            )
+        if len(output_map) == 0:
+            raise AssertionError("Output mapping must have at least one element")
 
         jlayers[-1]["weights"] = [[0] * len(prev_final_weights[0])] * len(output_map)
         jlayers[-1]["biases"] = [0] * len(output_map)
 
         for i, output_index in enumerate(output_map):
-            assert isinstance(output_index, int), "Output mapping must be a list of integers"
-            assert 0 <= output_index < len(prev_final_weights), "Output mapping must be in range of output size"
+            if not isinstance(output_index, int):
+                raise AssertionError("Output mapping must be a list of integers")
+            if not (0 <= output_index < len(prev_final_weights)):
+                raise AssertionError("Output mapping must be in range of output size")
             jlayers[-1]["weights"][i] = prev_final_weights[output_index]
             jlayers[-1]["biases"][i] = prev_final_bias[output_index]
 
     # Attempt to pretty print in a more readable form than json.dump; weights
     # will print as a 2D grid instead of a linear list of lists
-    assert len(dims) > 1
+    if len(dims) <= 1:
+        raise AssertionError("Model must contain at least one Dense layer")
 
     if len(jlayers[0]["weights"][0]) > 4:
-        assert (
-            input_channels == 1
-        ), "Only one channel is supported for > 4 network inputs"
-    else:
-        assert (
-            input_channels == 1 or input_channels == len(jlayers[0]["weights"][0])
-        ), f"Input channels must match input size {len(jlayers[0]['weights'][0])}"
+        if input_channels != 1:
+            raise AssertionError("Only one channel is supported for > 4 network inputs")
+    elif input_channels not in (1, len(jlayers[0]["weights"][0])):
+        raise AssertionError(
+            f"Input channels must match input size {len(jlayers[0]['weights'][0])}"
+        )
 
     if len(jlayers[-1]["weights"]) > 4:
-        assert (
-            output_channels == 1
-        ), "Only one channel is supported for > 4 network outputs"
-    else:
-        assert (
-            output_channels == 1 or output_channels == len(jlayers[-1]["weights"])
-        ), f"Output channels must match output size {len(jlayers[-1]['weights'])}"
+        if output_channels != 1:
+            raise AssertionError("Only one channel is supported for > 4 network outputs")
+    elif output_channels not in (1, len(jlayers[-1]["weights"])):
+        raise AssertionError(
+            f"Output channels must match output size {len(jlayers[-1]['weights'])}"
+        )
 
     return {
         "version": "0.1",
@@ -775,6 +922,8 @@ def get_linn(
     Keyword Args (Optional):
         output_mapping (list): A list of integers that selects which output neurons
                                should be used as the final output of the network.
+        calibration_inputs (numpy.ndarray): A batch of scaled network inputs used to check
+                               that the exported layers reproduce the model output.
 
     Returns:
         dict: The .linn JSON document or a dict of the network parameters suitable for loading in to the Neural Network instrument.
@@ -805,6 +954,8 @@ def save_linn(
     Keyword Args (Optional):
         output_mapping (list): A list of integers that selects which output neurons
                                should be used as the final output of the network.
+        calibration_inputs (numpy.ndarray): A batch of scaled network inputs used to check
+                               that the exported layers reproduce the model output.
     Returns:
         None. Saves the result to a .linn file for loading in to the Neural Network instrument.
     """
@@ -812,5 +963,13 @@ def save_linn(
     linn_data = convert_keras_to_linn(
         model=model, input_channels=input_channels, output_channels=output_channels, **kwargs
     )
-    with open(file_name, "w+") as _writer:
+    if orjson is not None:
+        # orjson encodes the whole document in C, so it goes out in a single write
+        with open(file_name, "wb") as _writer:
+            _writer.write(orjson.dumps(linn_data))
+        return
+
+    # json.dump writes the encoder's chunks as they are produced, so the document is
+    # never held as one string; the large buffer turns them into a few big writes
+    with open(file_name, "w", buffering=1 << 20) as _writer:
         json.dump(linn_data, _writer)
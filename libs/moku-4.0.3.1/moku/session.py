@@ -1,8 +1,15 @@
 import json
-from collections import namedtuple
+import mmap
+import os
+import re
+import weakref
+from collections import OrderedDict
 from functools import wraps
+from queue import Queue
+from threading import RLock, Thread
 
 from requests import Session
+from requests.adapters import HTTPAdapter
 
 from . import exceptions
 from .logging import get_logger
@@ -10,6 +17,53 @@ from .logging import get_logger
 # Set up logger for this module
 logger = get_logger('session')
 
+# bare nan/inf tokens the Moku emits, which are not valid JSON. String literals
+# are matched first so their contents are skipped over in the same pass
+_NAN_INF_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|(-?\b(?:inf|nan)\b)')
+
+
+def _quote_nan_inf(match):
+    token = match.group(1)
+    return b'"' + token + b'"' if token else match.group(0)
+
+
+# read size for file downloads
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+def _write_chunks(chunks, f, depth=16):
+    """
+    Writes the chunks to the file on a background thread, so
+    receiving the next chunk overlaps with writing the previous one
+    """
+    queue = Queue(maxsize=depth)
+    errors = []
+
+    def _writer():
+        try:
+            for chunk in iter(queue.get, None):
+                f.write(chunk)
+        except BaseException as e:
+            errors.append(e)
+            # keep draining so the receiving side never blocks on a full queue
+            for _ in iter(queue.get, None):
+                pass
+
+    writer = Thread(target=_writer, daemon=True)
+    writer.start()
+    bytes_written = 0
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            queue.put(chunk)
+            bytes_written += len(chunk)
+    finally:
+        queue.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+    return bytes_written
+
 
 def handle_response(func):
     """
@@ -30,43 +84,133 @@ class RequestSession:
     json_headers = {"Content-type": "application/json"}
     sk_name = "Moku-Client-Key"  # session key name
 
+    # requests sessions shared by every RequestSession to the same Moku, most recently used last
+    _session_cache = OrderedDict()
+    _session_cache_max = 32
+    # live RequestSessions per shared session; an evicted session is closed once this drops to 0
+    _session_users = {}
+    # reentrant: a finalizer can run (via gc) while the lock is held
+    _session_lock = RLock()
+
     def __init__(self, ip, connect_timeout, read_timeout, **kwargs):
         self.ip_address = ip
-        self.connect_timeout = connect_timeout
-        self.read_timeout = read_timeout
-        self.rs = Session()
-        logger.debug(f"Session initialized for {ip} with timeouts: connect={connect_timeout}s, read={read_timeout}s")
+        self._base_url = f"http://{ip}/api/"
+        self._url_cache = {}
+        self._timeout = (connect_timeout, read_timeout)
+        # the session key is sent per request, so it never leaks between
+        # connections sharing a requests session
+        self._headers = {}
+        self._json_headers = self.json_headers
 
         # support arbitrary session arguments
+        session_kwargs = {}
         for k, v in kwargs.items():
             if k.lower().startswith("session_"):
-                k = k.split("session_")[1]
-                setattr(self.rs, k, v)
+                session_kwargs[k.split("session_")[1]] = v
+
+        # a customised session is kept private to this connection
+        if session_kwargs:
+            self.rs = self._new_session()
+        else:
+            self.rs = self._shared_session(ip)
+            weakref.finalize(self, RequestSession._release_session, self.rs)
+        for k, v in session_kwargs.items():
+            setattr(self.rs, k, v)
+        logger.debug(
+            "Session initialized for %s with timeouts: connect=%ss, read=%ss",
+            ip, connect_timeout, read_timeout,
+        )
+
+    @staticmethod
+    def _new_session():
+        rs = Session()
+        # keep connections to the Moku alive and reuse them for every call
+        rs.mount(
+            "http://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=16, pool_block=False),
+        )
+        return rs
+
+    @classmethod
+    def _shared_session(cls, ip):
+        "Returns the requests session for ip, reusing its open connections"
+        with cls._session_lock:
+            rs = cls._session_cache.get(ip)
+            if rs is None:
+                rs = cls._session_cache[ip] = cls._new_session()
+                if len(cls._session_cache) > cls._session_cache_max:
+                    evicted = cls._session_cache.popitem(last=False)[1]
+                    # sessions still held by a live RequestSession are closed on release
+                    if not cls._session_users.get(evicted):
+                        cls._session_users.pop(evicted, None)
+                        evicted.close()
+            else:
+                cls._session_cache.move_to_end(ip)
+            cls._session_users[rs] = cls._session_users.get(rs, 0) + 1
+        return rs
+
+    @classmethod
+    def _release_session(cls, rs):
+        "Drops one user of a shared session, closing it if it was evicted and is now unused"
+        with cls._session_lock:
+            users = cls._session_users.get(rs, 0) - 1
+            if users > 0:
+                cls._session_users[rs] = users
+                return
+            cls._session_users.pop(rs, None)
+            if rs not in cls._session_cache.values():
+                rs.close()
+
+    def _set_key_header(self, key):
+        self._headers = {self.sk_name: key}
+        self._json_headers = {**self.json_headers, **self._headers}
 
     def update_sk(self, response):
         key = response.headers.get(self.sk_name)
         if key:
             self.session_key = key
-            self.rs.headers.update({self.sk_name: key})
-            logger.debug(f"Session key updated: {key[:8]}..." if len(key) > 8 else f"Session key updated: {key}")
+            self._set_key_header(key)
+            logger.debug("Session key updated: %s%s", key[:8], "..." if len(key) > 8 else "")
+
+    @property
+    def connect_timeout(self):
+        return self._timeout[0]
+
+    @connect_timeout.setter
+    def connect_timeout(self, value):
+        self._timeout = (value, self._timeout[1])
+
+    @property
+    def read_timeout(self):
+        return self._timeout[1]
+
+    @read_timeout.setter
+    def read_timeout(self, value):
+        self._timeout = (self._timeout[0], value)
 
     def url_for(self, group, operation):
-        return f"http://{self.ip_address}/api/{group}/{operation}"
+        url = self._url_cache.get((group, operation))
+        if url is None:
+            url = self._base_url + group + "/" + operation
+            self._url_cache[(group, operation)] = url
+        return url
 
     def url_for_v2(self, location):
-        return f"http://{self.ip_address}/api/v2/{location}"
+        return self.url_for("v2", location)
 
     def timeout_headers(self, rt_increase=0):
         "Returns timeout headers required for http request"
-        return tuple([self.connect_timeout, self.read_timeout + rt_increase])
+        if not rt_increase:
+            return self._timeout
+        return (self._timeout[0], self._timeout[1] + rt_increase)
 
     @handle_response
     def get(self, group, operation):
         "Executes get call and returns the response"
         url = self.url_for(group, operation)
-        logger.debug(f"GET {url}")
-        response = self.rs.get(url, timeout=self.timeout_headers())
-        logger.debug(f"GET {url} - Status: {response.status_code}")
+        logger.debug("GET %s", url)
+        response = self.rs.get(url, timeout=self.timeout_headers(), headers=self._headers)
+        logger.debug("GET %s - Status: %s", url, response.status_code)
         return response
 
     @handle_response
@@ -75,19 +219,16 @@ class RequestSession:
         # As get_data has an explicit read_timeout parameter,
         # it should be considered applicable cases, in all other
         # cases default it to 0
-        _timeout = None
-        if params:
-            _timeout = params.get("timeout", 0)
-        _to_inc = 0 if not _timeout else _timeout
+        _to_inc = (params.get("timeout") or 0) if params is not None else 0
         url = self.url_for(group, operation)
-        logger.debug(f"POST {url} with params: {params}")
+        logger.debug("POST %s with params: %s", url, params)
         response = self.rs.post(
             url,
             json=params,
             timeout=self.timeout_headers(_to_inc),
-            headers=self.json_headers,
+            headers=self._json_headers,
         )
-        logger.debug(f"POST {url} - Status: {response.status_code}")
+        logger.debug("POST %s - Status: %s", url, response.status_code)
         return response
 
     @handle_response
@@ -96,21 +237,21 @@ class RequestSession:
         return self.rs.post(
             self.url_for(group, operation),
             json=data,
-            headers=self.json_headers,
+            headers=self._json_headers,
         )
 
     def post_to_v2_raw(self, location, params=None):
         "Executes post call to api v2 and returns the response"
-        response = self.rs.post(self.url_for_v2(location), json=params)
+        response = self.rs.post(self.url_for_v2(location), json=params, headers=self._headers)
         return response
 
     def post_to_v2(self, location, params=None):
         url = self.url_for_v2(location)
-        logger.debug(f"POST v2 {url} with params: {params}")
-        response = self.rs.post(url, json=params)
-        logger.debug(f"POST v2 {url} - Status: {response.status_code}")
+        logger.debug("POST v2 %s with params: %s", url, params)
+        response = self.rs.post(url, json=params, headers=self._headers)
+        logger.debug("POST v2 %s - Status: %s", url, response.status_code)
         if response.status_code != 200:
-            logger.error(f"API v2 request failed with status {response.status_code}")
+            logger.error("API v2 request failed with status %s", response.status_code)
             raise exceptions.MokuException(
                 f"Cannot fulfil request, error code " f"{response.status_code}"
             )
@@ -118,38 +259,71 @@ class RequestSession:
 
     def get_file(self, group, operation, local_path):
         url = self.url_for(group, operation)
-        logger.debug(f"Downloading file from {url} to {local_path}")
-        with self.rs.get(url, stream=True) as r:
+        logger.debug("Downloading file from %s to %s", url, local_path)
+        with self.rs.get(url, stream=True, headers=self._headers) as r:
             with open(local_path, "wb") as f:
-                bytes_written = 0
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    bytes_written += len(chunk)
-        logger.info(f"Downloaded {bytes_written} bytes to {local_path}")
+                # reserve the whole file up front when its size is known
+                size = int(r.headers.get("Content-Length", 0))
+                if size and "Content-Encoding" not in r.headers and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, size)
+                    except OSError:
+                        # not supported by every filesystem (some NFS/FUSE/tmpfs setups)
+                        pass
+                # The body is not moved in-kernel: sendfile(2) can't read from a socket, and
+                # splicing the raw socket would skip bytes urllib3 has already buffered and
+                # copy chunked transfer framing into the file
+                bytes_written = _write_chunks(
+                    r.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE), f
+                )
+                f.truncate(bytes_written)
+        logger.info("Downloaded %s bytes to %s", bytes_written, local_path)
+
+    def _post_mapped_file(self, url, path):
+        "Uploads the file at path straight from a read-only memory map"
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            logger.debug("Uploading file %s to %s (%s bytes)", path, url, size)
+            if not size:
+                # an empty file can't be mapped
+                return self.rs.post(
+                    url, data=b"", timeout=self.timeout_headers(), headers=self._headers
+                )
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return self.rs.post(
+                        url, data=view, timeout=self.timeout_headers(), headers=self._headers
+                    )
 
     @handle_response
     def post_file(self, group, operation, data):
         url = self.url_for(group, operation)
+        if isinstance(data, os.PathLike):
+            response = self._post_mapped_file(url, data)
+            logger.debug("Upload to %s - Status: %s", url, response.status_code)
+            return response
         if hasattr(data, '__len__'):
-            logger.debug(f"Uploading file to {url} ({len(data)} bytes)")
+            logger.debug("Uploading file to %s (%s bytes)", url, len(data))
         else:
-            logger.debug(f"Uploading file to {url} (with type {type(data)}")
+            logger.debug("Uploading file to %s (with type %s", url, type(data))
         response = self.rs.post(
-            url, data=data, timeout=self.timeout_headers()
+            url, data=data, timeout=self.timeout_headers(), headers=self._headers
         )
-        logger.debug(f"Upload to {url} - Status: {response.status_code}")
+        logger.debug("Upload to %s - Status: %s", url, response.status_code)
         return response
 
     @handle_response
     def delete_file(self, group, operation):
         "Deletes the given file from the Moku"
         return self.rs.delete(
-            self.url_for(group, operation), timeout=self.timeout_headers()
+            self.url_for(group, operation),
+            timeout=self.timeout_headers(),
+            headers=self._headers,
         )
 
     @staticmethod
     def _handle_error(code, messages):
-        logger.error(f"API error: {code} - {messages}")
+        logger.error("API error: %s - %s", code, messages)
         if code == "NO_PLATFORM_BIT_STREAM":
             raise exceptions.NoPlatformBitstream(messages)
         elif code == "NO_BIT_STREAM":
@@ -169,7 +343,7 @@ class RequestSession:
     def echo_warnings(messages):
         "Prints any warnings received from Moku"
         for m in messages or []:
-            logger.warning(f"Device warning: {m}")
+            logger.warning("Device warning: %s", m)
             print(f"Warning: {m}")
 
     @staticmethod
@@ -180,31 +354,27 @@ class RequestSession:
         try:
             return json.loads(content)
         except json.decoder.JSONDecodeError:
-            content = content.replace("nan", '"nan"')
-            content = content.replace("inf", '"inf"')
+            if b"nan" not in content and b"inf" not in content:
+                raise
+            content = _NAN_INF_RE.sub(_quote_nan_inf, content)
             return json.loads(content, parse_constant=self._normalize_nan_inf)
 
     def resolve(self, response):
         "Resolves response received"
-
-        def _parse_to_object(content):
-            content = content.decode("utf-8")
-            content = self._check_and_normalize_nan_inf(content)
-            return namedtuple("_", content.keys())(*content.values())
-
         key = response.headers.get(self.sk_name)
         if key:
-            self.rs.headers.update({self.sk_name: key})
+            self._set_key_header(key)
         if response.status_code == 200:
-            data = _parse_to_object(response.content)
-            if data.success is True:
-                self.echo_warnings(data.messages)
-                return data.data
-            elif data.success is False:
-                self._handle_error(data.code, data.messages)
+            # json.loads decodes the raw UTF-8 bytes itself
+            data = self._check_and_normalize_nan_inf(response.content)
+            if data["success"] is True:
+                self.echo_warnings(data["messages"])
+                return data["data"]
+            elif data["success"] is False:
+                self._handle_error(data["code"], data["messages"])
         else:
             # Log the full response details for debugging
-            logger.debug(f"HTTP error response: {response.__dict__}")
+            logger.debug("HTTP error response: %s", response.__dict__)
             if response.status_code == 500:
                 raise exceptions.MokuException("Unhandled error received from Moku.")
             if response.status_code == 502:
@@ -1,10 +1,14 @@
+import atexit
 import json
 import os
+import time
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 import platform
+from shutil import which
 from subprocess import PIPE, Popen
-
-from packaging.specifiers import SpecifierSet
+from threading import Lock
 
 from .exceptions import InvalidParameterRange, MokuException, MokuNotFound, NoInstrumentBitstream
 from .finder import Finder
@@ -13,24 +17,74 @@ from .version import COMPAT_MOKUCLI
 from .logging import get_logger
 logger = get_logger(__name__.split('.')[-1])
 
-def find_moku_by_serial(serial):
-    result = Finder().find_all(timeout=10, filter=lambda x: x.serial == serial)
-    if len(result) > 0:
-        return result[0].ipv4_addr
-    raise MokuNotFound()
+# Process-wide discoverer, keeps listening for Mokus after the first lookup
+_discoverer = None
+_discoverer_lock = Lock()
+_discovered_ips = {}  # serial -> IPv4 address of every Moku currently announced
+_discovered_serials = {}  # zeroconf service name -> serial, to forget removed Mokus
+
+
+def _on_moku_added(name, record):
+    # also called when an announcement changes, e.g. a new IP after a DHCP renewal
+    old_serial = _discovered_serials.get(name)
+    if old_serial is not None and old_serial != record.serial:
+        _discovered_ips.pop(old_serial, None)
+    _discovered_serials[name] = record.serial
+    _discovered_ips[record.serial] = record.ipv4_addr
+
+
+def _on_moku_removed(name):
+    _discovered_ips.pop(_discovered_serials.pop(name, None), None)
+
+
+def _start_discoverer():
+    global _discoverer
+    with _discoverer_lock:
+        if _discoverer is None:
+            _discoverer = Finder(
+                on_add=_on_moku_added, on_remove=_on_moku_removed, on_update=_on_moku_added
+            )
+            _discoverer.start()
+            atexit.register(_discoverer.close)
+
+
+def find_moku_by_serial(serial, timeout=10):
+    _start_discoverer()
+    # answered straight away once the Moku has been announced
+    deadline = time.monotonic() + timeout
+    while serial not in _discovered_ips and time.monotonic() < deadline:
+        time.sleep(0.1)
+    ip = _discovered_ips.get(serial)
+    if ip is None:
+        raise MokuNotFound()
+    return ip
+
+
+@lru_cache(maxsize=16)
+def _mokucli_version_for(cli_path, mtime_ns, size):
+    """Run `mokucli --version`, cached for as long as the binary is unchanged."""
+    out, _ = Popen([cli_path, "--version"], stdout=PIPE, stderr=PIPE).communicate()
+    return out.decode("utf8").rstrip()
 
 
 def check_mokucli_version(cli_path):
+    # packaging is only needed here, keep it off the import path of moku
+    from packaging.specifiers import SpecifierSet
+
     req_ver = SpecifierSet(COMPAT_MOKUCLI)
-    out, _ = Popen([cli_path, "--version"], stdout=PIPE, stderr=PIPE).communicate()
-    if not out:
+    try:
+        cli_stat = os.stat(which(cli_path) or cli_path)
+    except (OSError, TypeError):
+        ver_str = ""
+    else:
+        ver_str = _mokucli_version_for(cli_path, cli_stat.st_mtime_ns, cli_stat.st_size)
+    if not ver_str:
         raise MokuException(
             f"Cannot find mokucli. \n"
             "Please download latest version of the CLI from https://www.liquidinstruments.com/software/utilities/. \n"  # noqa
             "If you have already installed, please set the MOKU_CLI_PATH environment variable to absolute path of mokucli."
         )
 
-    ver_str = out.decode("utf8").rstrip()
     if not req_ver.contains(ver_str):
         raise InvalidParameterRange(
             f"mokucli version {ver_str} is not compatible with this version of the API. \n"
@@ -39,12 +93,16 @@ def check_mokucli_version(cli_path):
             "If you have already installed, please set the MOKU_CLI_PATH environment variable to absolute path of mokucli."
         )
 
+@lru_cache(maxsize=None)
 def get_config_dir() -> Path:
     """Get the platform-specific configuration directory.
 
     This path resolution should exactly match the logic in mokucli.
 
     Corrolary: If you change this, change it in mokucli as well.
+
+    The result is cached for the process; call get_config_dir.cache_clear()
+    after changing APPDATA or XDG_CONFIG_HOME.
     """
     if platform.system() == "Windows":
         # If APPDATA is not set, use the user's home directory
@@ -54,7 +112,9 @@ def get_config_dir() -> Path:
     else:  # Linux and others
         return Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")) / "moku"
 
-def get_version_info(mokuOS_version):
+@lru_cache(maxsize=128)
+def _load_version_info(mokuOS_version):
+    """Parsed version manifest, cached and shared; callers must not modify it."""
     version_file = get_config_dir() / "data" / "versions" / f"{mokuOS_version}.json"
     logger.debug(f"Looking for version info in {version_file}")
     if not version_file.exists():
@@ -62,9 +122,25 @@ def get_version_info(mokuOS_version):
     with open(version_file, "r") as f:
         return json.load(f)
 
+def get_version_info(mokuOS_version):
+    """Load the version manifest for a mokuOS version.
+
+    The file is parsed once per process; each call returns a private copy that
+    the caller may modify. Call get_version_info.cache_clear() to re-read it.
+    """
+    return deepcopy(_load_version_info(mokuOS_version))
+
+get_version_info.cache_clear = _load_version_info.cache_clear
+
+@lru_cache(maxsize=128)
 def get_bitstream_path(mokuOS_version, hardware):
+    """Find the instrument bitstream directory for a mokuOS version and hardware.
+
+    Missing bitstreams raise and are not cached; call get_bitstream_path.cache_clear()
+    after moving the config directory.
+    """
     hw_dir = {"mokupro": "mokupro", "mokugo": "mokugo", "mokulab": "moku20", "mokudelta": "mokuaf"}
-    version_info = get_version_info(mokuOS_version)
+    version_info = _load_version_info(mokuOS_version)
     bitstream_path = get_config_dir() / "data" / "instruments" / version_info["instruments"] / hw_dir[hardware]
     logger.debug(f"Bitstream path: {bitstream_path}")
     if not bitstream_path.exists():
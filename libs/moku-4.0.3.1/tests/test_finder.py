@@ -0,0 +1,67 @@
+"""Tests for moku.finder and the background discoverer in moku.utilities."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from moku import finder, utilities
+
+SERVICE_TYPE = "_moku._tcp.local."
+NAME = f"Lilo.{SERVICE_TYPE}"
+
+
+def service_info(ip, serial=106):
+    properties = {
+        b"txtver": b"0.5", b"netver": b"1", b"fwver": b"600", b"hwver": b"3.0",
+        b"serial": str(serial).encode(), b"colour": b"black", b"bootmode": b"normal",
+    }
+    return SimpleNamespace(
+        name=NAME, type=SERVICE_TYPE, properties=properties,
+        parsed_addresses=lambda: [ip],
+    )
+
+
+class FakeZeroconf:
+    def __init__(self, **kwargs):
+        self.info = None
+
+    def get_service_info(self, service_type, name):
+        return self.info
+
+
+@pytest.fixture
+def discovered(monkeypatch):
+    monkeypatch.setattr(finder, "Zeroconf", FakeZeroconf)
+    monkeypatch.setattr(utilities, "_discovered_ips", {})
+    monkeypatch.setattr(utilities, "_discovered_serials", {})
+    listener = finder.Finder(
+        on_add=utilities._on_moku_added,
+        on_remove=utilities._on_moku_removed,
+        on_update=utilities._on_moku_added,
+    )
+    return listener, listener.zero_conf
+
+
+def test_update_refreshes_discovered_ip(discovered):
+    listener, zc = discovered
+    zc.info = service_info("192.168.1.100")
+    listener.add_service(zc, SERVICE_TYPE, NAME)
+    assert utilities._discovered_ips == {106: "192.168.1.100"}
+
+    zc.info = service_info("192.168.1.200")
+    listener.update_service(zc, SERVICE_TYPE, NAME)
+    assert utilities._discovered_ips == {106: "192.168.1.200"}
+    assert len(listener.moku_list) == 1
+
+    listener.remove_service(zc, SERVICE_TYPE, NAME)
+    assert utilities._discovered_ips == {}
+
+
+def test_update_with_new_serial_forgets_old_one(discovered):
+    listener, zc = discovered
+    zc.info = service_info("192.168.1.100", serial=106)
+    listener.add_service(zc, SERVICE_TYPE, NAME)
+
+    zc.info = service_info("192.168.1.100", serial=107)
+    listener.update_service(zc, SERVICE_TYPE, NAME)
+    assert utilities._discovered_ips == {107: "192.168.1.100"}
@@ -0,0 +1,45 @@
+"""Tests for moku.nn .linn export."""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+keras = pytest.importorskip("tensorflow.keras")
+
+from moku.nn import _linn  # noqa: E402
+from moku.nn._linn import get_linn, save_linn  # noqa: E402
+
+
+@pytest.fixture
+def model():
+    model = keras.Sequential([
+        keras.Input(shape=(2,)),
+        keras.layers.Dense(4, activation="relu"),
+        keras.layers.Dense(1, activation="linear"),
+    ])
+    model.build((None, 2))
+    return model
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_linn_round_trip(model, tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(_linn, "orjson", None)
+    elif _linn.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    file_name = tmp_path / "model.linn"
+    save_linn(model, input_channels=2, output_channels=1, file_name=str(file_name))
+
+    with open(file_name) as f:
+        assert json.load(f) == get_linn(model, input_channels=2, output_channels=1)
+
+
+def test_save_linn_keeps_json_dump_format(model, tmp_path, monkeypatch):
+    monkeypatch.setattr(_linn, "orjson", None)
+    file_name = tmp_path / "model.linn"
+    save_linn(model, input_channels=2, output_channels=1, file_name=str(file_name))
+
+    expected = json.dumps(get_linn(model, input_channels=2, output_channels=1))
+    assert file_name.read_text() == expected
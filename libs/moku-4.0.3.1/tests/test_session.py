@@ -0,0 +1,78 @@
+"""Tests for moku.session."""
+
+import gc
+import json
+import threading
+from collections import OrderedDict
+
+import pytest
+
+from moku.session import RequestSession, _NAN_INF_RE, _quote_nan_inf
+
+
+def test_quote_nan_inf_skips_string_literals():
+    content = b'{"msg": "say \\"nan\\" or inf", "v": nan, "w": -inf, "x": [inf]}'
+    data = json.loads(_NAN_INF_RE.sub(_quote_nan_inf, content))
+    assert data == {'msg': 'say "nan" or inf', 'v': 'nan', 'w': '-inf', 'x': ['inf']}
+
+
+def test_quote_nan_inf_leaves_names_containing_nan_alone():
+    content = b'{"infinity_mode": "nanometer", "v": nan}'
+    data = json.loads(_NAN_INF_RE.sub(_quote_nan_inf, content))
+    assert data == {'infinity_mode': 'nanometer', 'v': 'nan'}
+
+
+@pytest.fixture
+def session_cache(monkeypatch):
+    monkeypatch.setattr(RequestSession, "_session_cache", OrderedDict())
+    monkeypatch.setattr(RequestSession, "_session_users", {})
+    monkeypatch.setattr(RequestSession, "_session_cache_max", 1)
+
+
+def test_sessions_to_same_moku_share_requests_session(session_cache):
+    first = RequestSession("10.0.0.1", 1, 1)
+    second = RequestSession("10.0.0.1", 1, 1)
+    assert first.rs is second.rs
+    assert RequestSession._session_users[first.rs] == 2
+
+
+def test_evicted_session_closed_after_last_user(session_cache):
+    first = RequestSession("10.0.0.1", 1, 1)
+    closed = []
+    first.rs.close = lambda: closed.append(True)
+
+    RequestSession("10.0.0.2", 1, 1)  # evicts 10.0.0.1 while first still uses it
+    assert closed == []
+
+    del first
+    gc.collect()
+    assert closed == [True]
+
+
+def test_unused_session_closed_on_eviction(session_cache):
+    rs = RequestSession("10.0.0.1", 1, 1).rs
+    closed = []
+    rs.close = lambda: closed.append(True)
+    gc.collect()
+
+    RequestSession("10.0.0.2", 1, 1)
+    assert closed == [True]
+
+
+def test_concurrent_construction(session_cache):
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(200):
+                RequestSession(f"10.0.0.{(n + i) % 5}", 1, 1)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(RequestSession._session_cache) == 1
@@ -0,0 +1,35 @@
+"""Tests for moku.utilities."""
+
+import json
+
+import pytest
+
+from moku import utilities
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(utilities, "get_config_dir", lambda: tmp_path)
+    versions = tmp_path / "data" / "versions"
+    versions.mkdir(parents=True)
+    (versions / "601.json").write_text(json.dumps({"instruments": "abc", "mokuos": ["601"]}))
+    utilities.get_version_info.cache_clear()
+    yield tmp_path
+    utilities.get_version_info.cache_clear()
+
+
+def test_version_info_returns_private_copies(config_dir):
+    info = utilities.get_version_info(601)
+    info["instruments"] = "changed"
+    info["mokuos"].append("602")
+
+    assert utilities.get_version_info(601) == {"instruments": "abc", "mokuos": ["601"]}
+
+
+def test_version_info_is_parsed_once(config_dir):
+    assert utilities.get_version_info(601)["instruments"] == "abc"
+    (config_dir / "data" / "versions" / "601.json").write_text(json.dumps({"instruments": "new"}))
+    assert utilities.get_version_info(601)["instruments"] == "abc"
+
+    utilities.get_version_info.cache_clear()
+    assert utilities.get_version_info(601)["instruments"] == "new"
@@ -8,13 +8,27 @@ Core Abstraction:
     MokuConfig - THE central deployment model for this project
 """
 
-from moku_models.platforms.moku_go import MokuGoPlatform, MOKU_GO_PLATFORM
-from moku_models.platforms.moku_lab import MokuLabPlatform, MOKU_LAB_PLATFORM
-from moku_models.platforms.moku_pro import MokuProPlatform, MOKU_PRO_PLATFORM
-from moku_models.platforms.moku_delta import MokuDeltaPlatform, MOKU_DELTA_PLATFORM
-from moku_models.routing import MokuConnection, MokuConnectionList
-from moku_models.moku_config import MokuConfig, SlotConfig, MokuPlatformConfig
-from moku_models.discovery import MokuDeviceInfo, MokuDeviceCache
+from importlib import import_module
+
+# Submodules are imported on first attribute access (PEP 562), so e.g. importing
+# moku_models.platforms.moku_go does not build every other model's schema
+_LAZY_ATTRS = {
+    'MokuConfig': 'moku_config',
+    'SlotConfig': 'moku_config',
+    'MokuPlatformConfig': 'moku_config',
+    'MokuGoPlatform': 'platforms.moku_go',
+    'MOKU_GO_PLATFORM': 'platforms.moku_go',
+    'MokuLabPlatform': 'platforms.moku_lab',
+    'MOKU_LAB_PLATFORM': 'platforms.moku_lab',
+    'MokuProPlatform': 'platforms.moku_pro',
+    'MOKU_PRO_PLATFORM': 'platforms.moku_pro',
+    'MokuDeltaPlatform': 'platforms.moku_delta',
+    'MOKU_DELTA_PLATFORM': 'platforms.moku_delta',
+    'MokuConnection': 'routing',
+    'MokuConnectionList': 'routing',
+    'MokuDeviceInfo': 'discovery',
+    'MokuDeviceCache': 'discovery',
+}
 
 __all__ = [
     # Core abstraction (use this!)
@@ -42,3 +56,16 @@ __all__ = [
     # Backward compatibility (deprecated)
     'MokuPlatformConfig',
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'{__name__}.{module_name}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
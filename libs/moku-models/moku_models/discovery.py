@@ -9,7 +9,7 @@ References:
 - Zeroconf: _moku._tcp.local. service discovery
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Optional
 
 
@@ -99,6 +99,10 @@ class MokuDeviceInfo(BaseModel):
         return False
 
 
+# Validates/serializes a whole devices dict in one pydantic-core call
+_DEVICES_ADAPTER = TypeAdapter(dict[str, MokuDeviceInfo])
+
+
 class MokuDeviceCache(BaseModel):
     """
     Cache of discovered Moku devices.
@@ -120,22 +124,75 @@ class MokuDeviceCache(BaseModel):
         description="Devices keyed by IP address"
     )
 
+    def _index(self) -> tuple[dict[str, str], dict[str, str]]:
+        """
+        Lowercase name → IP and lowercase serial → IP, first device wins as in a scan.
+
+        Kept in the instance __dict__ (outside the model fields, so equality and
+        serialization ignore it) and rebuilt when `devices` is replaced or a scan
+        finds a device the index does not know about.
+        """
+        cache = self.__dict__.get('_lookup_index')
+        if cache is None or cache[0] is not self.devices:
+            cache = self._build_index()
+        return cache[1], cache[2]
+
+    def _build_index(self) -> tuple:
+        by_name: dict[str, str] = {}
+        by_serial: dict[str, str] = {}
+        for ip, device in self.devices.items():
+            if device.canonical_name:
+                by_name.setdefault(device.canonical_name.lower(), ip)
+            if device.serial_number:
+                by_serial.setdefault(device.serial_number.lower(), ip)
+        cache = (self.devices, by_name, by_serial)
+        self.__dict__['_lookup_index'] = cache
+        return cache
+
     def add_device(self, device: MokuDeviceInfo) -> None:
         """Add or update device in cache."""
+        replaced = device.ip in self.devices
         self.devices[device.ip] = device
+        if replaced:
+            # the old entry's name/serial may no longer apply
+            self._build_index()
+        else:
+            by_name, by_serial = self._index()
+            if device.canonical_name:
+                by_name.setdefault(device.canonical_name.lower(), device.ip)
+            if device.serial_number:
+                by_serial.setdefault(device.serial_number.lower(), device.ip)
 
     def find_by_identifier(self, identifier: str) -> Optional[MokuDeviceInfo]:
         """
         Find device by IP address, name, or serial number.
 
+        The first matching device in `devices` order wins. The name/serial index
+        answers the common case; a miss, a stale entry (e.g. after `devices` was
+        edited directly) or more than one candidate falls back to a linear scan.
+
         Args:
             identifier: IP, device name, or serial number
 
         Returns:
             MokuDeviceInfo if found, None otherwise
         """
-        for device in self.devices.values():
+        by_name, by_serial = self._index()
+        key = identifier.lower()
+        candidates = {by_name.get(key), by_serial.get(key)}
+        if identifier in self.devices:
+            candidates.add(identifier)
+        candidates.discard(None)
+        if len(candidates) == 1:
+            device = self.devices.get(next(iter(candidates)))
+            if device is not None and device.matches_identifier(identifier):
+                return device
+
+        for ip, device in self.devices.items():
             if device.matches_identifier(identifier):
+                if ip not in candidates:
+                    # devices was edited behind the index's back
+                    self._build_index()
                 return device
         return None
 
@@ -146,13 +203,18 @@ class MokuDeviceCache(BaseModel):
     def clear(self) -> None:
         """Clear all cached devices."""
         self.devices.clear()
+        self.__dict__.pop('_lookup_index', None)
 
     def to_cache_dict(self) -> dict:
         """Export as dictionary for JSON storage."""
-        return {ip: device.to_cache_dict() for ip, device in self.devices.items()}
+        return _DEVICES_ADAPTER.dump_python(self.devices)
 
     @classmethod
     def from_cache_dict(cls, data: dict) -> 'MokuDeviceCache':
-        """Load from cached dictionary."""
-        devices = {ip: MokuDeviceInfo.from_cache_dict(dev_data) for ip, dev_data in data.items()}
-        return cls(devices=devices)
+        """
+        Load from cached dictionary.
+
+        The cache file is user-editable, so every entry is validated (in a single
+        pydantic-core call) and bad data raises ValidationError here.
+        """
+        return cls(devices=_DEVICES_ADAPTER.validate_python(data))
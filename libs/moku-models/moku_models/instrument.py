@@ -16,7 +16,6 @@ Date: 2025-10-24
 from pathlib import Path
 from typing import Optional
 from pydantic import BaseModel, Field
-import yaml
 
 
 class InstrumentManifest(BaseModel):
@@ -54,12 +53,16 @@ class InstrumentManifest(BaseModel):
     @classmethod
     def from_yaml(cls, yaml_path: Path | str) -> 'InstrumentManifest':
         """Load manifest from YAML file."""
+        import yaml
+
         with open(yaml_path) as f:
             data = yaml.safe_load(f)
         return cls(**data)
 
     def to_yaml(self, yaml_path: Path | str) -> None:
         """Save manifest to YAML file."""
+        import yaml
+
         with open(yaml_path, 'w') as f:
             yaml.dump(self.model_dump(exclude_none=True), f, sort_keys=False)
 
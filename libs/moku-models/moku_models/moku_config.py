@@ -7,11 +7,72 @@ Works for BOTH simulation (behavioral models) and hardware (real Moku).
 This is the central Python abstraction for the entire project.
 """
 
-from typing import Any
-from pydantic import BaseModel, Field, field_validator
+from functools import lru_cache
+from itertools import product
+from operator import is_
+from typing import Annotated, Any
+from pydantic import (
+    BaseModel, Discriminator, Field, Tag, field_validator, model_validator
+)
+from moku_models.platforms.moku_delta import MokuDeltaPlatform
 from moku_models.platforms.moku_go import MokuGoPlatform
+from moku_models.platforms.moku_lab import MokuLabPlatform
+from moku_models.platforms.moku_pro import MokuProPlatform
 from moku_models.routing import MokuConnection
 
+# Virtual port suffixes available on every instrument slot (SlotNInA ... SlotNOutD)
+_SLOT_PORT_SUFFIXES = ('InA', 'InB', 'InC', 'InD', 'OutA', 'OutB', 'OutC', 'OutD')
+
+
+# Instrument names from the moku library; validated names resolve to these shared strings
+_KNOWN_INSTRUMENTS = {
+    name: name
+    for name in (
+        'ArbitraryWaveformGenerator', 'CloudCompile', 'Datalogger', 'DigitalFilterBox',
+        'FIRFilterBox', 'FrequencyResponseAnalyzer', 'LaserLockBox', 'LockInAmp',
+        'LogicAnalyzer', 'NeuralNetwork', 'Oscilloscope', 'Phasemeter', 'PIDController',
+        'SpectrumAnalyzer', 'TimeFrequencyAnalyzer', 'WaveformGenerator',
+    )
+}
+
+
+# Routing error message, filled from an (index, 'source'/'destination', port) error
+_ROUTING_ERROR = "Connection {0}: Invalid {1} port '{2}'"
+
+
+def _platform_tag(v: Any) -> str | None:
+    """Discriminator for MokuConfig.platform; dicts without hardware_id default to Moku:Go."""
+    if isinstance(v, dict):
+        return v.get('hardware_id', 'mokugo')
+    return getattr(v, 'hardware_id', None)
+
+
+# Validation dispatches straight to the matching platform model by hardware_id
+_Platform = Annotated[
+    Annotated[MokuGoPlatform, Tag('mokugo')]
+    | Annotated[MokuLabPlatform, Tag('mokulab')]
+    | Annotated[MokuProPlatform, Tag('mokupro')]
+    | Annotated[MokuDeltaPlatform, Tag('mokudelta')],
+    Discriminator(_platform_tag),
+]
+
+
+@lru_cache(maxsize=64)
+def _slot_port_set(slot_nums: tuple[int, ...]) -> frozenset[str]:
+    """Virtual port names for the given slot numbers (slot layouts repeat across configs)."""
+    return frozenset(f'Slot{s}{p}' for s, p in product(slot_nums, _SLOT_PORT_SUFFIXES))
+
+
+@lru_cache(maxsize=128)
+def _compute_valid_ports(
+    platform_id: str,
+    input_port_ids: tuple[str, ...],
+    output_port_ids: tuple[str, ...],
+    slot_nums: tuple[int, ...],
+) -> frozenset[str]:
+    """Valid routing port names for a platform/slot layout, shared by configs that match it."""
+    return _slot_port_set(slot_nums).union(input_port_ids, output_port_ids)
+
 
 class SlotConfig(BaseModel):
     """
@@ -32,6 +93,9 @@ class SlotConfig(BaseModel):
     @classmethod
     def validate_instrument_name(cls, v: str) -> str:
         """Validate instrument name is non-empty."""
+        known = _KNOWN_INSTRUMENTS.get(v)
+        if known is not None:
+            return known
         if not v or not v.strip():
             raise ValueError("Instrument name cannot be empty")
         return v.strip()
@@ -70,7 +134,7 @@ class MokuConfig(BaseModel):
         ... )
     """
 
-    platform: MokuGoPlatform = Field(..., description="Moku platform specification")
+    platform: _Platform = Field(..., description="Moku platform specification")
     slots: dict[int, SlotConfig] = Field(..., description="Slot configurations")
     routing: list[MokuConnection] = Field(default_factory=list, description="MCC signal routing")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Optional metadata")
@@ -82,15 +146,26 @@ class MokuConfig(BaseModel):
         if not v:
             raise ValueError("At least one slot must be configured")
 
+        # None when the platform itself failed validation
         platform = info.data.get('platform')
-        if platform:
-            max_slots = platform.slots
-            for slot_num in v.keys():
-                if slot_num < 1 or slot_num > max_slots:
-                    raise ValueError(f"Slot {slot_num} out of range for platform (1-{max_slots})")
+        if platform is None:
+            return v
+
+        max_slots = platform.slots
+        if min(v) < 1 or max(v) > max_slots:
+            # Report the first offending slot, as a per-key check would
+            slot_num = next(n for n in v if n < 1 or n > max_slots)
+            raise ValueError(f"Slot {slot_num} out of range for platform (1-{max_slots})")
 
         return v
 
+    @model_validator(mode='after')
+    def _check_routing_on_init(self) -> 'MokuConfig':
+        # Routing errors are computed once here and reported by validate_routing(),
+        # not raised, so configs with unfinished routing can still be built
+        self._routing_errors()
+        return self
+
     def validate_routing(self) -> list[str]:
         """
         Validate all routing connections reference valid ports.
@@ -98,30 +173,79 @@ class MokuConfig(BaseModel):
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
+        cache = self._routing_errors_entry()
+        if cache[4] is None:
+            cache[4] = tuple(_ROUTING_ERROR.format(*err) for err in cache[3])
+        return list(cache[4])
+
+    @property
+    def routing_is_valid(self) -> bool:
+        """True if every routing connection references a valid port (no message formatting)."""
+        return not self._routing_errors()
 
-        # Build list of valid port names
-        valid_ports = set()
+    def _routing_errors(self) -> tuple[tuple[int, str, str], ...]:
+        """Unformatted (index, 'source'/'destination', port) routing errors."""
+        return self._routing_errors_entry()[3]
 
-        # Add platform physical ports
-        for inp in self.platform.analog_inputs:
-            valid_ports.add(inp.port_id)  # IN1, IN2
-        for out in self.platform.analog_outputs:
-            valid_ports.add(out.port_id)  # OUT1, OUT2
+    def _routing_errors_entry(self) -> list:
+        valid_ports = self._valid_ports()
+        routing = self.routing
+        # Memoized in the instance __dict__ (outside the model fields and private
+        # attributes, so equality and serialization ignore it), keyed on the inputs.
+        # Connections are frozen, so the list object plus a snapshot of its elements
+        # catches reassignment as well as append, += and item replacement.
+        # Entry: [valid ports, routing, snapshot, raw errors, formatted errors or None]
+        cache = self.__dict__.get('_routing_errors_cache')
+        if (
+            cache is None
+            or cache[0] is not valid_ports
+            or cache[1] is not routing
+            or len(cache[2]) != len(routing)
+            or not all(map(is_, cache[2], routing))
+        ):
+            snapshot = tuple(routing)
+            errors = self._check_routing(valid_ports, snapshot)
+            cache = [valid_ports, routing, snapshot, errors, None]
+            self.__dict__['_routing_errors_cache'] = cache
+        return cache
 
-        # Add slot virtual ports (SlotNInA, SlotNOutA, etc.)
-        for slot_num in self.slots.keys():
-            for port_type in ['InA', 'InB', 'InC', 'InD', 'OutA', 'OutB', 'OutC', 'OutD']:
-                valid_ports.add(f'Slot{slot_num}{port_type}')
+    @staticmethod
+    def _check_routing(
+        valid_ports: frozenset[str], routing: tuple[MokuConnection, ...]
+    ) -> tuple[tuple[int, str, str], ...]:
+        errors = []
+        errors_append = errors.append
 
         # Validate each connection
-        for idx, conn in enumerate(self.routing):
+        for idx, conn in enumerate(routing):
             if conn.source not in valid_ports:
-                errors.append(f"Connection {idx}: Invalid source port '{conn.source}'")
+                errors_append((idx, 'source', conn.source))
             if conn.destination not in valid_ports:
-                errors.append(f"Connection {idx}: Invalid destination port '{conn.destination}'")
+                errors_append((idx, 'destination', conn.destination))
+
+        return tuple(errors)
+
+    def _valid_ports(self) -> frozenset[str]:
+        """
+        Set of port names routing may reference on this platform/slot layout.
+
+        Built once and reused until the platform or the set of slot numbers changes.
+        """
+        platform = self.platform
+        slot_nums = tuple(self.slots)
+        cache = self.__dict__.get('_valid_ports_cache')
+        if cache is not None and cache[0] is platform and cache[1] == slot_nums:
+            return cache[2]
 
-        return errors
+        # Platform physical ports (IN1, OUT1, ...) and slot virtual ports (SlotNInA, ...)
+        valid_ports = _compute_valid_ports(
+            platform.hardware_id,
+            tuple(inp.port_id for inp in platform.analog_inputs),
+            tuple(out.port_id for out in platform.analog_outputs),
+            slot_nums,
+        )
+        self.__dict__['_valid_ports_cache'] = (platform, slot_nums, valid_ports)
+        return valid_ports
 
     def get_slot(self, slot_num: int) -> SlotConfig | None:
         """Get configuration for specific slot number."""
@@ -129,6 +253,8 @@ class MokuConfig(BaseModel):
 
     def get_instrument_slots(self, instrument_type: str) -> list[int]:
         """Get list of slot numbers containing specified instrument type."""
+        # Scanned on every call: slots holds at most a handful of entries and
+        # both the dict and its SlotConfigs can be edited in place
         return [
             slot_num
             for slot_num, config in self.slots.items()
@@ -137,7 +263,8 @@ class MokuConfig(BaseModel):
 
     def to_dict(self) -> dict:
         """Export configuration as dictionary for serialization."""
-        return self.model_dump()
+        # Same output as model_dump(), minus its per-call option handling
+        return self.__pydantic_serializer__.to_python(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> 'MokuConfig':
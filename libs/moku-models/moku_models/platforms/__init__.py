@@ -4,10 +4,20 @@ Moku Platform Physical Models
 Hardware specifications for different Moku platforms (Go, Lab, Pro, Delta).
 """
 
-from moku_models.platforms.moku_go import MokuGoPlatform, MOKU_GO_PLATFORM
-from moku_models.platforms.moku_lab import MokuLabPlatform, MOKU_LAB_PLATFORM
-from moku_models.platforms.moku_pro import MokuProPlatform, MOKU_PRO_PLATFORM
-from moku_models.platforms.moku_delta import MokuDeltaPlatform, MOKU_DELTA_PLATFORM
+from importlib import import_module
+
+# Platform modules are imported on first attribute access (PEP 562), so importing
+# one platform does not build the schemas of the others
+_LAZY_ATTRS = {
+    'MokuGoPlatform': 'moku_go',
+    'MOKU_GO_PLATFORM': 'moku_go',
+    'MokuLabPlatform': 'moku_lab',
+    'MOKU_LAB_PLATFORM': 'moku_lab',
+    'MokuProPlatform': 'moku_pro',
+    'MOKU_PRO_PLATFORM': 'moku_pro',
+    'MokuDeltaPlatform': 'moku_delta',
+    'MOKU_DELTA_PLATFORM': 'moku_delta',
+}
 
 __all__ = [
     'MokuGoPlatform',
@@ -19,3 +29,16 @@ __all__ = [
     'MokuDeltaPlatform',
     'MOKU_DELTA_PLATFORM',
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'{__name__}.{module_name}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,93 @@
+"""
+Shared Physical Port Models
+
+Port specifications common to every Moku platform module. Defined once so all
+platforms validate against the same AnalogPort schema.
+"""
+
+import sys
+from dataclasses import fields
+from operator import attrgetter, is_
+from typing import Any, Callable, Literal, Sequence
+from pydantic import Field, field_validator
+from pydantic.dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class AnalogPort:
+    """
+    Physical analog I/O port (BNC connector).
+
+    Attributes:
+        port_id: Port identifier (e.g., 'IN1', 'OUT1')
+        connector_type: Physical connector (always 'BNC' on Moku hardware)
+        direction: Signal direction
+        resolution_bits: ADC/DAC bit depth
+        sample_rate_msa: Sample rate in MSa/s
+        voltage_range_vpp: Peak-to-peak voltage range
+        impedance: Input impedance
+    """
+    port_id: str = Field(..., description="Port identifier (e.g., 'IN1', 'OUT1')")
+    connector_type: Literal['BNC'] = Field(default='BNC', description="Physical connector type")
+    direction: Literal['input', 'output'] = Field(..., description="Signal direction")
+    resolution_bits: int = Field(..., description="ADC/DAC bit depth")
+    sample_rate_msa: int = Field(..., description="Sample rate in MSa/s")
+    voltage_range_vpp: float = Field(..., description="Peak-to-peak voltage range in volts")
+    impedance: str = Field(..., description="Input impedance (e.g., '50Ohm', '1MOhm')")
+
+    @field_validator('port_id')
+    @classmethod
+    def _intern_port_id(cls, v: str) -> str:
+        # Port IDs come from a small vocabulary; share one string object per ID
+        return sys.intern(v)
+
+
+_ANALOG_PORT_FIELDS = tuple(f.name for f in fields(AnalogPort))
+_analog_port_row = attrgetter(*_ANALOG_PORT_FIELDS)
+
+
+def analog_port_columns(ports: Sequence[AnalogPort]) -> dict[str, tuple]:
+    """
+    Column view of a port list: field name → tuple of that field's values in port order.
+
+    Lets bulk queries run on plain tuples, e.g. max(columns['sample_rate_msa']).
+    """
+    if not ports:
+        return dict.fromkeys(_ANALOG_PORT_FIELDS, ())
+    return dict(zip(_ANALOG_PORT_FIELDS, zip(*map(_analog_port_row, ports))))
+
+
+def cached_for_list(owner: Any, cache_name: str, items: list, build: Callable[[list], Any]) -> Any:
+    """
+    `build(items)`, cached in the owner's __dict__.
+
+    Rebuilt when the list object is replaced (assignment, model_copy(update=...)) or
+    any of its elements is added, removed or replaced in place. The elements are
+    frozen, so their identities are a complete key; the cached snapshot holds them,
+    so an id cannot be reused while the entry is alive.
+    """
+    cache = owner.__dict__.get(cache_name)
+    if (
+        cache is None
+        or cache[0] is not items
+        or len(cache[1]) != len(items)
+        or not all(map(is_, cache[1], items))
+    ):
+        cache = (items, tuple(items), build(items))
+        owner.__dict__[cache_name] = cache
+    return cache[2]
+
+
+def cached_index(owner: Any, cache_name: str, items: list, key: str) -> dict:
+    """
+    {getattr(item, key): item} lookup for `items`, cached like cached_for_list().
+
+    The first item wins on duplicate keys.
+    """
+    def build(items: list) -> dict:
+        index = {}
+        for item in items:
+            index.setdefault(getattr(item, key), item)
+        return index
+
+    return cached_for_list(owner, cache_name, items, build)
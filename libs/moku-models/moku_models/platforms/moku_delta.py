@@ -27,33 +27,17 @@ References:
 - Official specs: https://www.liquidinstruments.com/products/moku-delta/
 """
 
+from functools import cache
 from typing import Literal
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
+from moku_models.platforms._ports import (
+    AnalogPort, analog_port_columns, cached_for_list, cached_index,
+)
 
 
-class AnalogPort(BaseModel):
-    """
-    Physical analog I/O port (BNC connector).
-
-    Attributes:
-        port_id: Port identifier (e.g., 'IN1', 'OUT1')
-        connector_type: Physical connector (always 'BNC' for Moku:Delta)
-        direction: Signal direction
-        resolution_bits: ADC/DAC bit depth
-        sample_rate_msa: Sample rate in MSa/s
-        voltage_range_vpp: Peak-to-peak voltage range
-        impedance: Input impedance
-    """
-    port_id: str = Field(..., description="Port identifier (e.g., 'IN1', 'OUT1')")
-    connector_type: Literal['BNC'] = Field(default='BNC', description="Physical connector type")
-    direction: Literal['input', 'output'] = Field(..., description="Signal direction")
-    resolution_bits: int = Field(..., description="ADC/DAC bit depth")
-    sample_rate_msa: int = Field(..., description="Sample rate in MSa/s")
-    voltage_range_vpp: float = Field(..., description="Peak-to-peak voltage range in volts")
-    impedance: str = Field(..., description="Input impedance (e.g., '50Ohm', '1MOhm')")
-
-
-class DIOPort(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DIOPort:
     """
     Digital I/O header specification.
 
@@ -76,6 +60,37 @@ class DIOPort(BaseModel):
     connector_type: str = Field(default='ribbon_cable', description="Physical connector type")
 
 
+# Default ports are frozen, so every platform instance shares these validated instances
+_ANALOG_INPUTS = tuple(
+    AnalogPort(
+        port_id=f'IN{i}',
+        direction='input',
+        resolution_bits=14,
+        sample_rate_msa=5000,
+        voltage_range_vpp=40.0,  # Max range: 100mV, 1V, 10V, or 40Vpp (±20V)
+        impedance='1MOhm'  # Switchable 50Ω or 1MΩ, default to 1MΩ
+    )
+    for i in range(1, 9)
+)
+
+_ANALOG_OUTPUTS = tuple(
+    AnalogPort(
+        port_id=f'OUT{i}',
+        direction='output',
+        resolution_bits=14,
+        sample_rate_msa=5000,  # Native 5 GHz (ignoring 10 GHz interpolation)
+        voltage_range_vpp=10.0,  # ±5V up to 100 MHz, ±500mV up to 2 GHz (use max)
+        impedance='50Ohm'
+    )
+    for i in range(1, 9)
+)
+
+_DIO_HEADERS = tuple(
+    DIOPort(header_id=f'DIO{i}', num_pins=16, sample_rate_msa=5000)
+    for i in range(1, 3)
+)
+
+
 class MokuDeltaPlatform(BaseModel):
     """
     Moku:Delta Physical Platform Model (3-Slot Standard Mode).
@@ -122,7 +137,7 @@ class MokuDeltaPlatform(BaseModel):
 
     # Platform identification
     name: str = Field(default='Moku:Delta', description="Platform name")
-    hardware_id: str = Field(default='mokudelta', description="Hardware identifier (moku library)")
+    hardware_id: Literal['mokudelta'] = Field(default='mokudelta', description="Hardware identifier (moku library)")
     ip_address: str | None = Field(default=None, description="Device IP address")
     device_name: str | None = Field(default=None, description="User-assigned device name")
 
@@ -131,151 +146,18 @@ class MokuDeltaPlatform(BaseModel):
 
     # Physical analog I/O (BNC connectors) - 8 inputs, 8 outputs
     analog_inputs: list[AnalogPort] = Field(
-        default_factory=lambda: [
-            AnalogPort(
-                port_id='IN1',
-                direction='input',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=40.0,  # Max range: 100mV, 1V, 10V, or 40Vpp (±20V)
-                impedance='1MOhm'  # Switchable 50Ω or 1MΩ, default to 1MΩ
-            ),
-            AnalogPort(
-                port_id='IN2',
-                direction='input',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=40.0,
-                impedance='1MOhm'
-            ),
-            AnalogPort(
-                port_id='IN3',
-                direction='input',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=40.0,
-                impedance='1MOhm'
-            ),
-            AnalogPort(
-                port_id='IN4',
-                direction='input',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=40.0,
-                impedance='1MOhm'
-            ),
-            AnalogPort(
-                port_id='IN5',
-                direction='input',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=40.0,
-                impedance='1MOhm'
-            ),
-            AnalogPort(
-                port_id='IN6',
-                direction='input',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=40.0,
-                impedance='1MOhm'
-            ),
-            AnalogPort(
-                port_id='IN7',
-                direction='input',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=40.0,
-                impedance='1MOhm'
-            ),
-            AnalogPort(
-                port_id='IN8',
-                direction='input',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=40.0,
-                impedance='1MOhm'
-            ),
-        ],
+        default_factory=lambda: list(_ANALOG_INPUTS),
         description="Physical analog input ports (BNC)"
     )
 
     analog_outputs: list[AnalogPort] = Field(
-        default_factory=lambda: [
-            AnalogPort(
-                port_id='OUT1',
-                direction='output',
-                resolution_bits=14,
-                sample_rate_msa=5000,  # Native 5 GHz (ignoring 10 GHz interpolation)
-                voltage_range_vpp=10.0,  # ±5V up to 100 MHz, ±500mV up to 2 GHz (use max)
-                impedance='50Ohm'
-            ),
-            AnalogPort(
-                port_id='OUT2',
-                direction='output',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=10.0,
-                impedance='50Ohm'
-            ),
-            AnalogPort(
-                port_id='OUT3',
-                direction='output',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=10.0,
-                impedance='50Ohm'
-            ),
-            AnalogPort(
-                port_id='OUT4',
-                direction='output',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=10.0,
-                impedance='50Ohm'
-            ),
-            AnalogPort(
-                port_id='OUT5',
-                direction='output',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=10.0,
-                impedance='50Ohm'
-            ),
-            AnalogPort(
-                port_id='OUT6',
-                direction='output',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=10.0,
-                impedance='50Ohm'
-            ),
-            AnalogPort(
-                port_id='OUT7',
-                direction='output',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=10.0,
-                impedance='50Ohm'
-            ),
-            AnalogPort(
-                port_id='OUT8',
-                direction='output',
-                resolution_bits=14,
-                sample_rate_msa=5000,
-                voltage_range_vpp=10.0,
-                impedance='50Ohm'
-            ),
-        ],
+        default_factory=lambda: list(_ANALOG_OUTPUTS),
         description="Physical analog output ports (BNC)"
     )
 
     # Digital I/O - 2 separate 16-pin headers (32 pins total)
     dio_headers: list[DIOPort] = Field(
-        default_factory=lambda: [
-            DIOPort(header_id='DIO1', num_pins=16, sample_rate_msa=5000),
-            DIOPort(header_id='DIO2', num_pins=16, sample_rate_msa=5000)
-        ],
+        default_factory=lambda: list(_DIO_HEADERS),
         description="Digital I/O headers (2 separate 16-pin headers)"
     )
 
@@ -285,6 +167,8 @@ class MokuDeltaPlatform(BaseModel):
     @property
     def clock_period_ns(self) -> float:
         """Clock period in nanoseconds."""
+        # Not cached: clock_mhz is an ordinary (assignable) field, and one divide
+        # is cheaper than any staleness check. Hoist it out of tight loops instead.
         return 1000.0 / self.clock_mhz
 
     @property
@@ -292,17 +176,27 @@ class MokuDeltaPlatform(BaseModel):
         """Total number of DIO pins across all headers."""
         return sum(header.num_pins for header in self.dio_headers)
 
+    @property
+    def analog_input_columns(self) -> dict[str, tuple]:
+        """Analog input fields as columns (e.g. max(columns['sample_rate_msa'])), cached per list."""
+        return cached_for_list(self, '_input_columns', self.analog_inputs, analog_port_columns)
+
+    @property
+    def analog_output_columns(self) -> dict[str, tuple]:
+        """Analog output fields as columns, cached per list."""
+        return cached_for_list(self, '_output_columns', self.analog_outputs, analog_port_columns)
+
     def get_analog_input_by_id(self, port_id: str) -> AnalogPort | None:
         """Get analog input port by ID (e.g., 'IN1')."""
-        return next((p for p in self.analog_inputs if p.port_id == port_id), None)
+        return cached_index(self, '_input_index', self.analog_inputs, 'port_id').get(port_id)
 
     def get_analog_output_by_id(self, port_id: str) -> AnalogPort | None:
         """Get analog output port by ID (e.g., 'OUT1')."""
-        return next((p for p in self.analog_outputs if p.port_id == port_id), None)
+        return cached_index(self, '_output_index', self.analog_outputs, 'port_id').get(port_id)
 
     def get_dio_header_by_id(self, header_id: str) -> DIOPort | None:
         """Get DIO header by ID (e.g., 'DIO1')."""
-        return next((h for h in self.dio_headers if h.header_id == header_id), None)
+        return cached_index(self, '_dio_index', self.dio_headers, 'header_id').get(header_id)
 
     def __str__(self) -> str:
         """Human-readable representation."""
@@ -311,5 +205,14 @@ class MokuDeltaPlatform(BaseModel):
         return f"{self.name}{name_str}{ip_str}: {len(self.analog_inputs)}IN/{len(self.analog_outputs)}OUT, {self.total_dio_pins}DIO"
 
 
-# Convenience constant for use in configs
-MOKU_DELTA_PLATFORM = MokuDeltaPlatform()
+@cache
+def get_default_platform() -> MokuDeltaPlatform:
+    """Shared default MokuDeltaPlatform, built on first use."""
+    return MokuDeltaPlatform()
+
+
+def __getattr__(name: str):
+    # Convenience constant for use in configs (MOKU_DELTA_PLATFORM), built on first access
+    if name == 'MOKU_DELTA_PLATFORM':
+        return get_default_platform()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
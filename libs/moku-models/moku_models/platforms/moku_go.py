@@ -9,33 +9,15 @@ References:
 - Moku library: moku.instruments._mim.MultiInstrument
 """
 
+from functools import cache
 from typing import Literal
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
+from moku_models.platforms._ports import AnalogPort, cached_index
 
 
-class AnalogPort(BaseModel):
-    """
-    Physical analog I/O port (BNC connector).
-
-    Attributes:
-        port_id: Port identifier (e.g., 'IN1', 'OUT1')
-        connector_type: Physical connector (always 'BNC' for Moku:Go)
-        direction: Signal direction
-        resolution_bits: ADC/DAC bit depth
-        sample_rate_msa: Sample rate in MSa/s
-        voltage_range_vpp: Peak-to-peak voltage range
-        impedance: Input impedance
-    """
-    port_id: str = Field(..., description="Port identifier (e.g., 'IN1', 'OUT1')")
-    connector_type: Literal['BNC'] = Field(default='BNC', description="Physical connector type")
-    direction: Literal['input', 'output'] = Field(..., description="Signal direction")
-    resolution_bits: int = Field(..., description="ADC/DAC bit depth")
-    sample_rate_msa: int = Field(..., description="Sample rate in MSa/s")
-    voltage_range_vpp: float = Field(..., description="Peak-to-peak voltage range in volts")
-    impedance: str = Field(..., description="Input impedance (e.g., '50Ohm', '1MOhm')")
-
-
-class DIOPort(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DIOPort:
     """
     Digital I/O header specification.
 
@@ -56,6 +38,34 @@ class DIOPort(BaseModel):
     connector_type: str = Field(default='ribbon_cable', description="Physical connector type")
 
 
+# Default ports are frozen, so every platform instance shares these validated instances
+_ANALOG_INPUTS = tuple(
+    AnalogPort(
+        port_id=f'IN{i}',
+        direction='input',
+        resolution_bits=12,
+        sample_rate_msa=125,
+        voltage_range_vpp=50.0,  # ±25V range
+        impedance='1MOhm'
+    )
+    for i in range(1, 3)
+)
+
+_ANALOG_OUTPUTS = tuple(
+    AnalogPort(
+        port_id=f'OUT{i}',
+        direction='output',
+        resolution_bits=12,
+        sample_rate_msa=125,
+        voltage_range_vpp=10.0,  # ±5V range
+        impedance='50Ohm'
+    )
+    for i in range(1, 3)
+)
+
+_DIO_HEADER = DIOPort()
+
+
 class MokuGoPlatform(BaseModel):
     """
     Moku:Go Physical Platform Model.
@@ -91,7 +101,7 @@ class MokuGoPlatform(BaseModel):
 
     # Platform identification
     name: str = Field(default='Moku:Go', description="Platform name")
-    hardware_id: str = Field(default='mokugo', description="Hardware identifier (moku library)")
+    hardware_id: Literal['mokugo'] = Field(default='mokugo', description="Hardware identifier (moku library)")
     ip_address: str | None = Field(default=None, description="Device IP address")
     device_name: str | None = Field(default=None, description="User-assigned device name")
 
@@ -100,52 +110,18 @@ class MokuGoPlatform(BaseModel):
 
     # Physical analog I/O (BNC connectors)
     analog_inputs: list[AnalogPort] = Field(
-        default_factory=lambda: [
-            AnalogPort(
-                port_id='IN1',
-                direction='input',
-                resolution_bits=12,
-                sample_rate_msa=125,
-                voltage_range_vpp=50.0,  # ±25V range
-                impedance='1MOhm'
-            ),
-            AnalogPort(
-                port_id='IN2',
-                direction='input',
-                resolution_bits=12,
-                sample_rate_msa=125,
-                voltage_range_vpp=50.0,
-                impedance='1MOhm'
-            ),
-        ],
+        default_factory=lambda: list(_ANALOG_INPUTS),
         description="Physical analog input ports (BNC)"
     )
 
     analog_outputs: list[AnalogPort] = Field(
-        default_factory=lambda: [
-            AnalogPort(
-                port_id='OUT1',
-                direction='output',
-                resolution_bits=12,
-                sample_rate_msa=125,
-                voltage_range_vpp=10.0,  # ±5V range
-                impedance='50Ohm'
-            ),
-            AnalogPort(
-                port_id='OUT2',
-                direction='output',
-                resolution_bits=12,
-                sample_rate_msa=125,
-                voltage_range_vpp=10.0,
-                impedance='50Ohm'
-            ),
-        ],
+        default_factory=lambda: list(_ANALOG_OUTPUTS),
         description="Physical analog output ports (BNC)"
     )
 
     # Digital I/O
     dio: DIOPort = Field(
-        default_factory=DIOPort,
+        default_factory=lambda: _DIO_HEADER,
         description="Digital I/O header specification"
     )
 
@@ -155,15 +131,17 @@ class MokuGoPlatform(BaseModel):
     @property
     def clock_period_ns(self) -> float:
         """Clock period in nanoseconds."""
+        # Not cached: clock_mhz is an ordinary (assignable) field, and one divide
+        # is cheaper than any staleness check. Hoist it out of tight loops instead.
         return 1000.0 / self.clock_mhz
 
     def get_analog_input_by_id(self, port_id: str) -> AnalogPort | None:
         """Get analog input port by ID (e.g., 'IN1')."""
-        return next((p for p in self.analog_inputs if p.port_id == port_id), None)
+        return cached_index(self, '_input_index', self.analog_inputs, 'port_id').get(port_id)
 
     def get_analog_output_by_id(self, port_id: str) -> AnalogPort | None:
         """Get analog output port by ID (e.g., 'OUT1')."""
-        return next((p for p in self.analog_outputs if p.port_id == port_id), None)
+        return cached_index(self, '_output_index', self.analog_outputs, 'port_id').get(port_id)
 
     def __str__(self) -> str:
         """Human-readable representation."""
@@ -172,5 +150,14 @@ class MokuGoPlatform(BaseModel):
         return f"{self.name}{name_str}{ip_str}: {len(self.analog_inputs)}IN/{len(self.analog_outputs)}OUT, {self.dio.num_pins}DIO"
 
 
-# Convenience constant for use in tests/configs
-MOKU_GO_PLATFORM = MokuGoPlatform()
+@cache
+def get_default_platform() -> MokuGoPlatform:
+    """Shared default MokuGoPlatform, built on first use."""
+    return MokuGoPlatform()
+
+
+def __getattr__(name: str):
+    # Convenience constant for use in configs (MOKU_GO_PLATFORM), built on first access
+    if name == 'MOKU_GO_PLATFORM':
+        return get_default_platform()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
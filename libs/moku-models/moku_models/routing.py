@@ -18,7 +18,49 @@ References:
 - Serena memory: platform_models.md (MCC routing concepts)
 """
 
-from pydantic import BaseModel, Field, field_validator
+import struct
+import sys
+from functools import cached_property
+from typing import IO, Any, Iterable, Iterator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+
+def _port_vocabulary() -> dict[str, str]:
+    """Port names from the moku naming conventions (see MokuConnection), as interned strings."""
+    names = [f'{prefix}{n}' for prefix in ('Input', 'Output', 'IN', 'OUT') for n in range(1, 9)]
+    names += [f'{prefix}{ch}' for prefix in ('Input', 'Output') for ch in 'ABCD']
+    names += ['DIO', 'DIO1', 'DIO2']
+    names += [
+        f'Slot{slot}{direction}{ch}'
+        for slot in range(1, 9) for direction in ('In', 'Out') for ch in 'ABCD'
+    ]
+    return {name: sys.intern(name) for name in names}
+
+
+# Valid port name -> its interned string, so connections share one object per name
+_PORT_NAMES = _port_vocabulary()
+
+
+def _port_name(v: str) -> str:
+    """
+    Known port name for `v` (surrounding whitespace ignored), as the interned string.
+
+    Shared by MokuConnection validation and the construct-based constructors so
+    they all accept and reject the same names.
+
+    Raises:
+        ValueError: If the name is empty or not a known Moku port
+    """
+    known = _PORT_NAMES.get(v)
+    if known is not None:
+        return known
+    v = v.strip()
+    if not v:
+        raise ValueError("Port name cannot be empty")
+    known = _PORT_NAMES.get(v)
+    if known is None:
+        raise ValueError(f"Unknown port {v!r}")
+    return known
 
 
 class MokuConnection(BaseModel):
@@ -37,6 +79,10 @@ class MokuConnection(BaseModel):
     - Slot virtual inputs: 'Slot1InA', 'Slot1InB', 'Slot1InC', 'Slot1InD'
     - Slot virtual outputs: 'Slot1OutA', 'Slot1OutB', 'Slot1OutC', 'Slot1OutD'
     - Alternative naming: 'InputA', 'OutputA', etc. (also valid)
+    - Platform port IDs: 'IN1'..'IN8', 'OUT1'..'OUT8'; digital I/O: 'DIO', 'DIO1', 'DIO2'
+
+    Names outside this vocabulary (up to 8 inputs/outputs and 8 slots) are rejected;
+    use MokuConnection.unchecked() to build a connection from trusted names as-is.
 
     Attributes:
         source: Source port identifier
@@ -48,38 +94,83 @@ class MokuConnection(BaseModel):
         {'source': 'Input1', 'destination': 'Slot1InA'}
     """
 
+    # The validator is built on first use rather than at import
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     source: str = Field(..., description="Source port identifier")
     destination: str = Field(..., description="Destination port identifier")
 
     @field_validator('source', 'destination')
     @classmethod
     def validate_port_name(cls, v: str) -> str:
-        """Validate port name is non-empty and properly formatted."""
-        if not v or not v.strip():
-            raise ValueError("Port name cannot be empty")
-        return v.strip()
+        """Validate port name is a known Moku port (surrounding whitespace ignored)."""
+        return _port_name(v)
+
+    @classmethod
+    def unchecked(cls, source: str, destination: str) -> 'MokuConnection':
+        """
+        Create a connection from trusted port names without any validation.
+
+        Args:
+            source: Source port identifier
+            destination: Destination port identifier
+
+        Returns:
+            MokuConnection instance
+        """
+        return cls.model_construct(source=sys.intern(source), destination=sys.intern(destination))
+
+    @cached_property
+    def _as_dict(self) -> dict[str, str]:
+        return {'source': self.source, 'destination': self.destination}
 
     def to_dict(self) -> dict[str, str]:
         """
         Export as dict compatible with moku library's set_connections() API.
 
+        Each call returns a fresh copy of a dict built once (the model is frozen).
+
         Returns:
             Dictionary with 'source' and 'destination' keys
         """
-        return {'source': self.source, 'destination': self.destination}
+        return self._as_dict.copy()
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> 'MokuConnection':
+        copied = super().model_copy(update=update, deep=deep)
+        # The cached dict is copied along with __dict__ and may not match `update`
+        copied.__dict__.pop('_as_dict', None)
+        return copied
 
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> 'MokuConnection':
         """
         Create connection from moku library dict format.
 
+        Port names are checked against the port vocabulary (the same rules as
+        MokuConnection validation) without running full model validation.
+
         Args:
             data: Dictionary with 'source' and 'destination' keys
 
         Returns:
             MokuConnection instance
+
+        Raises:
+            ValueError: If either port name is empty or not a known Moku port
         """
-        return cls(source=data['source'], destination=data['destination'])
+        return cls.model_construct(
+            source=_port_name(data['source']),
+            destination=_port_name(data['destination']),
+        )
+
+
+# Validates/serializes a whole connection list in one pydantic-core call
+_CONNECTIONS_ADAPTER = TypeAdapter(list[MokuConnection], config=ConfigDict(defer_build=True))
+
+# Frame header for routing snapshot streams: payload length, 4-byte big-endian
+_FRAME_HEADER = struct.Struct('>I')
 
 
 class MokuConnectionList(BaseModel):
@@ -89,6 +180,10 @@ class MokuConnectionList(BaseModel):
     Provides a typed wrapper around the moku library's connection list format
     with batch validation and conversion methods.
 
+    Connections are stored as MokuConnection models since `connections` is public
+    API; internal consumers that only need the port names can use to_pairs() to
+    get plain (source, destination) tuples.
+
     Attributes:
         connections: List of MokuConnection objects
 
@@ -100,6 +195,9 @@ class MokuConnectionList(BaseModel):
         >>> dict_list = conn_list.to_dict_list()  # For moku library API
     """
 
+    # The validator is built on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
+
     connections: list[MokuConnection] = Field(
         default_factory=list,
         description="List of signal routing connections"
@@ -112,28 +210,149 @@ class MokuConnectionList(BaseModel):
         Returns:
             List of dicts with 'source' and 'destination' keys
         """
-        return [conn.to_dict() for conn in self.connections]
+        return [conn._as_dict.copy() for conn in self.connections]
 
     @classmethod
     def from_dict_list(cls, data: list[dict[str, str]]) -> 'MokuConnectionList':
         """
         Create from moku library's connection list format.
 
+        Port names are checked against the port vocabulary (the same rules as
+        MokuConnection validation) without running full model validation per
+        connection. Use from_dict_list_validated() for input whose entries may not
+        be dicts of strings.
+
         Args:
             data: List of dicts with 'source' and 'destination' keys
 
         Returns:
             MokuConnectionList instance
+
+        Raises:
+            ValueError: If any port name is empty or not a known Moku port
+        """
+        return cls.from_pairs((d['source'], d['destination']) for d in data)
+
+    @classmethod
+    def from_dict_list_validated(cls, data: list[dict[str, str]]) -> 'MokuConnectionList':
+        """
+        Create from moku library's connection list format, validating every entry.
+
+        Use this for untrusted input (user files, API boundaries); from_dict_list()
+        checks only the port names. Errors are collected into one ValidationError.
+
+        Args:
+            data: List of dicts with 'source' and 'destination' keys
+
+        Returns:
+            MokuConnectionList instance
+        """
+        return cls.model_construct(connections=_CONNECTIONS_ADAPTER.validate_python(data))
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[str, str]]) -> 'MokuConnectionList':
+        """
+        Create from (source, destination) port name pairs.
+
+        Names are stripped and looked up in the port vocabulary in a single pass
+        (the same rules as MokuConnection validation) without a full validation per
+        connection.
+
+        Args:
+            pairs: Iterable of (source, destination) tuples
+
+        Returns:
+            MokuConnectionList instance
+
+        Raises:
+            ValueError: If any port name is empty or not a known Moku port
+        """
+        construct = MokuConnection.model_construct
+        port_name = _port_name
+        connections = []
+        connections_append = connections.append
+        for idx, (source, destination) in enumerate(pairs):
+            try:
+                conn = construct(source=port_name(source), destination=port_name(destination))
+            except ValueError as e:
+                raise ValueError(f"Connection {idx}: {e}") from None
+            connections_append(conn)
+        return cls.model_construct(connections=connections)
+
+    def to_pairs(self) -> list[tuple[str, str]]:
+        """
+        Convert to (source, destination) tuples, for callers that don't need dicts.
+
+        Returns:
+            List of (source, destination) tuples
+        """
+        return [(conn.source, conn.destination) for conn in self.connections]
+
+    def to_json(self) -> bytes:
+        """
+        Serialize as a JSON array of moku library connection dicts.
+
+        Returns:
+            UTF-8 encoded JSON, e.g. b'[{"source":"Input1","destination":"Slot1InA"}]'
+        """
+        return _CONNECTIONS_ADAPTER.dump_json(self.connections)
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> 'MokuConnectionList':
+        """
+        Parse and validate a JSON array of connection dicts (as written by to_json()).
+
+        Args:
+            data: JSON text or bytes
+
+        Returns:
+            MokuConnectionList instance
+        """
+        return cls.model_construct(connections=_CONNECTIONS_ADAPTER.validate_json(data))
+
+    def to_frame(self) -> bytes:
+        """
+        Serialize as one length-prefixed frame for appending to a snapshot stream.
+
+        Returns:
+            4-byte big-endian payload length followed by the to_json() payload
+        """
+        payload = self.to_json()
+        return _FRAME_HEADER.pack(len(payload)) + payload
+
+    @classmethod
+    def from_frame_stream(cls, fp: IO[bytes]) -> Iterator['MokuConnectionList']:
+        """
+        Read the frames written by to_frame() from a binary file, in order.
+
+        Args:
+            fp: Binary file positioned at the start of a frame
+
+        Yields:
+            MokuConnectionList for each frame
+
+        Raises:
+            ValueError: If the stream ends partway through a frame
         """
-        connections = [MokuConnection.from_dict(d) for d in data]
-        return cls(connections=connections)
+        header_size = _FRAME_HEADER.size
+        while header := fp.read(header_size):
+            if len(header) < header_size:
+                raise ValueError("Truncated routing frame header")
+            (size,) = _FRAME_HEADER.unpack(header)
+            payload = fp.read(size)
+            if len(payload) < size:
+                raise ValueError(
+                    f"Truncated routing frame: expected {size} bytes, got {len(payload)}"
+                )
+            yield cls.from_json(payload)
 
     def add(self, source: str, destination: str) -> None:
         """Add a new connection to the list."""
         self.connections.append(MokuConnection(source=source, destination=destination))
 
+    # Iterate the connections directly rather than BaseModel's (field, value) pairs
     def __len__(self) -> int:
         return len(self.connections)
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[MokuConnection]:
         return iter(self.connections)
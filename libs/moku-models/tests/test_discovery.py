@@ -0,0 +1,54 @@
+"""Tests for moku_models.discovery."""
+
+from moku_models.discovery import MokuDeviceCache, MokuDeviceInfo
+
+
+def make_device(ip: str, name: str, serial: str) -> MokuDeviceInfo:
+    return MokuDeviceInfo(
+        ip=ip, canonical_name=name, serial_number=serial, last_seen='2025-10-24T23:30:00'
+    )
+
+
+def test_find_by_identifier():
+    cache = MokuDeviceCache()
+    cache.add_device(make_device('192.168.1.100', 'Lilo', 'MG106B'))
+    cache.add_device(make_device('192.168.1.101', 'Stitch', 'MG107B'))
+
+    assert cache.find_by_identifier('lilo').ip == '192.168.1.100'
+    assert cache.find_by_identifier('mg107b').ip == '192.168.1.101'
+    assert cache.find_by_identifier('192.168.1.101').canonical_name == 'Stitch'
+    assert cache.find_by_identifier('Nani') is None
+
+
+def test_find_follows_direct_edits():
+    cache = MokuDeviceCache()
+    cache.add_device(make_device('192.168.1.100', 'Lilo', 'MG106B'))
+    assert cache.find_by_identifier('Lilo') is not None
+
+    cache.devices['192.168.1.101'] = make_device('192.168.1.101', 'Stitch', 'MG107B')
+    cache.devices['192.168.1.100'].canonical_name = 'Nani'
+    assert cache.find_by_identifier('Stitch').ip == '192.168.1.101'
+    assert cache.find_by_identifier('Nani').ip == '192.168.1.100'
+    assert cache.find_by_identifier('Lilo') is None
+
+
+def test_first_device_wins():
+    cache = MokuDeviceCache()
+    cache.add_device(make_device('192.168.1.100', 'Lilo', 'MG106B'))
+    cache.add_device(make_device('192.168.1.101', 'MG106B', 'MG107B'))
+    assert cache.find_by_identifier('MG106B').ip == '192.168.1.100'
+
+
+def test_equality_ignores_lookup_index():
+    devices = {'192.168.1.100': make_device('192.168.1.100', 'Lilo', 'MG106B')}
+    used = MokuDeviceCache(devices=dict(devices))
+    used.find_by_identifier('Lilo')
+    assert used == MokuDeviceCache(devices=dict(devices))
+
+
+def test_cache_dict_round_trip():
+    cache = MokuDeviceCache()
+    cache.add_device(make_device('192.168.1.100', 'Lilo', 'MG106B'))
+    loaded = MokuDeviceCache.from_cache_dict(cache.to_cache_dict())
+    assert loaded == cache
+    assert loaded.find_by_identifier('lilo').ip == '192.168.1.100'
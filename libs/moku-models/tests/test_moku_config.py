@@ -0,0 +1,104 @@
+"""Tests for moku_models.moku_config."""
+
+import pytest
+from pydantic import ValidationError
+
+from moku_models.moku_config import MokuConfig, SlotConfig
+from moku_models.platforms.moku_delta import MokuDeltaPlatform
+from moku_models.platforms.moku_go import MOKU_GO_PLATFORM, MokuGoPlatform
+from moku_models.platforms.moku_lab import MokuLabPlatform
+from moku_models.platforms.moku_pro import MokuProPlatform
+from moku_models.routing import MokuConnection
+
+
+def make_config(**kwargs) -> MokuConfig:
+    kwargs.setdefault('platform', MOKU_GO_PLATFORM)
+    kwargs.setdefault('slots', {1: SlotConfig(instrument='Oscilloscope')})
+    return MokuConfig(**kwargs)
+
+
+def test_routing_errors_follow_slots_reassignment():
+    config = make_config(routing=[MokuConnection(source='IN1', destination='Slot2InA')])
+    assert config.validate_routing()
+
+    config.slots = {
+        1: SlotConfig(instrument='Oscilloscope'),
+        2: SlotConfig(instrument='Phasemeter'),
+    }
+    assert config.validate_routing() == []
+
+
+def test_instrument_slots_follow_slots_reassignment():
+    config = make_config()
+    assert config.get_instrument_slots('Oscilloscope') == [1]
+
+    config.slots = {2: SlotConfig(instrument='Oscilloscope')}
+    assert config.get_instrument_slots('Oscilloscope') == [2]
+
+
+def test_instrument_slots_follow_in_place_edits():
+    config = make_config()
+    assert config.get_instrument_slots('Oscilloscope') == [1]
+
+    config.slots[1] = SlotConfig(instrument='Phasemeter')
+    assert config.get_instrument_slots('Oscilloscope') == []
+    assert config.get_instrument_slots('Phasemeter') == [1]
+
+    config.slots[1].instrument = 'Oscilloscope'
+    assert config.get_instrument_slots('Oscilloscope') == [1]
+    assert config.get_instrument_slots('Phasemeter') == []
+
+
+@pytest.mark.parametrize('platform_cls', [
+    MokuGoPlatform, MokuLabPlatform, MokuProPlatform, MokuDeltaPlatform,
+])
+def test_platform_dict_selects_model_by_hardware_id(platform_cls):
+    data = platform_cls().model_dump()
+    config = make_config(platform=data)
+    assert type(config.platform) is platform_cls
+
+
+def test_platform_dict_without_hardware_id_is_moku_go():
+    data = MOKU_GO_PLATFORM.model_dump()
+    del data['hardware_id']
+    assert type(make_config(platform=data).platform) is MokuGoPlatform
+
+
+def test_platform_unknown_hardware_id_rejected():
+    data = MOKU_GO_PLATFORM.model_dump()
+    data['hardware_id'] = 'mokuxyz'
+    with pytest.raises(ValidationError):
+        make_config(platform=data)
+
+
+def test_routing_errors_follow_routing_reassignment():
+    config = make_config(routing=[MokuConnection(source='IN1', destination='Slot1InA')])
+    assert config.validate_routing() == []
+
+    config.routing = [MokuConnection(source='IN1', destination='Slot2InA')]
+    assert config.validate_routing()
+
+
+def test_routing_errors_follow_in_place_edits():
+    config = make_config(routing=[MokuConnection(source='IN1', destination='Slot1InA')])
+    assert config.routing_is_valid
+
+    config.routing.append(MokuConnection(source='Slot2OutA', destination='OUT1'))
+    assert config.validate_routing() == ["Connection 1: Invalid source port 'Slot2OutA'"]
+
+    config.routing[1] = MokuConnection(source='Slot1OutA', destination='OUT1')
+    assert config.routing_is_valid
+
+    config.routing += [MokuConnection(source='IN1', destination='Slot3InA')]
+    assert config.validate_routing() == ["Connection 2: Invalid destination port 'Slot3InA'"]
+    assert isinstance(config.model_dump()['routing'], list)
+
+
+def test_routing_is_valid():
+    config = make_config(routing=[MokuConnection(source='IN1', destination='Slot1InA')])
+    assert config.routing_is_valid
+    assert config.validate_routing() == []
+
+    config = make_config(routing=[MokuConnection(source='IN1', destination='Slot2InA')])
+    assert not config.routing_is_valid
+    assert config.validate_routing() == ["Connection 0: Invalid destination port 'Slot2InA'"]
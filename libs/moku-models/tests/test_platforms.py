@@ -0,0 +1,44 @@
+"""Tests for the platform models' cached port lookups."""
+
+from dataclasses import replace
+from importlib import import_module
+
+import pytest
+
+import moku_models
+from moku_models.platforms.moku_delta import MokuDeltaPlatform
+from moku_models.platforms.moku_go import MokuGoPlatform
+
+
+def test_input_lookup_follows_in_place_replacement():
+    platform = MokuGoPlatform()
+    first = platform.analog_inputs[0]
+    assert platform.get_analog_input_by_id(first.port_id) is first
+
+    renamed = replace(first, port_id='IN9')
+    platform.analog_inputs[0] = renamed
+    assert platform.get_analog_input_by_id(first.port_id) is None
+    assert platform.get_analog_input_by_id('IN9') is renamed
+
+
+def test_columns_follow_in_place_replacement():
+    platform = MokuDeltaPlatform()
+    rate = platform.analog_input_columns['sample_rate_msa'][0]
+
+    platform.analog_inputs[0] = replace(platform.analog_inputs[0], sample_rate_msa=rate + 1)
+    assert platform.analog_input_columns['sample_rate_msa'][0] == rate + 1
+
+
+@pytest.mark.parametrize('module_name, constant', [
+    ('moku_go', 'MOKU_GO_PLATFORM'),
+    ('moku_lab', 'MOKU_LAB_PLATFORM'),
+    ('moku_pro', 'MOKU_PRO_PLATFORM'),
+    ('moku_delta', 'MOKU_DELTA_PLATFORM'),
+])
+def test_default_platform_built_on_demand_and_shared(module_name, constant):
+    module = import_module(f'moku_models.platforms.{module_name}')
+    assert constant not in vars(module)
+
+    platform = getattr(module, constant)
+    assert platform is module.get_default_platform()
+    assert getattr(moku_models, constant) is platform
@@ -0,0 +1,108 @@
+"""Tests for moku_models.routing."""
+
+import io
+
+import pytest
+from pydantic import ValidationError
+
+from moku_models.routing import MokuConnection, MokuConnectionList
+
+
+PAIRS = [('Input1', 'Slot1InA'), ('Slot1OutA', 'Output1')]
+
+
+def test_from_dict_list_validated():
+    data = [{'source': ' Input1', 'destination': 'Slot1InA'}]
+    conn_list = MokuConnectionList.from_dict_list_validated(data)
+    assert conn_list.to_dict_list() == [{'source': 'Input1', 'destination': 'Slot1InA'}]
+
+    with pytest.raises(ValidationError):
+        MokuConnectionList.from_dict_list_validated([{'source': ' ', 'destination': 'Output1'}])
+
+
+def test_from_pairs_round_trip():
+    conn_list = MokuConnectionList.from_pairs([(' Input1 ', 'Slot1InA'), PAIRS[1]])
+    assert conn_list.to_pairs() == PAIRS
+    assert conn_list.to_dict_list() == [
+        {'source': 'Input1', 'destination': 'Slot1InA'},
+        {'source': 'Slot1OutA', 'destination': 'Output1'},
+    ]
+
+
+def test_frame_stream_round_trip():
+    first = MokuConnectionList.from_pairs(PAIRS)
+    second = MokuConnectionList.from_pairs(PAIRS[:1])
+    stream = io.BytesIO(first.to_frame() + second.to_frame())
+
+    frames = list(MokuConnectionList.from_frame_stream(stream))
+
+    assert [frame.to_pairs() for frame in frames] == [PAIRS, PAIRS[:1]]
+
+
+def test_frame_stream_truncated_payload():
+    frame = MokuConnectionList.from_pairs(PAIRS).to_frame()
+    with pytest.raises(ValueError, match="Truncated routing frame"):
+        list(MokuConnectionList.from_frame_stream(io.BytesIO(frame[:-1])))
+
+
+def test_frame_stream_truncated_header():
+    with pytest.raises(ValueError, match="Truncated routing frame header"):
+        list(MokuConnectionList.from_frame_stream(io.BytesIO(b'\x00\x00')))
+
+
+def test_connection_rejects_unknown_port():
+    with pytest.raises(ValidationError, match="Unknown port 'Foo'"):
+        MokuConnection(source='Foo', destination='Output1')
+
+
+def test_connection_rejects_empty_port():
+    with pytest.raises(ValidationError, match="cannot be empty"):
+        MokuConnection(source='Input1', destination='  ')
+
+
+def test_connection_strips_known_port():
+    conn = MokuConnection(source=' Input1 ', destination='Slot1InA')
+    assert conn.source == 'Input1'
+
+
+def test_to_dict_returns_independent_dicts():
+    conn = MokuConnection(source='Input1', destination='Slot1InA')
+    conn.to_dict()['source'] = 'Output1'
+    assert conn.to_dict() == {'source': 'Input1', 'destination': 'Slot1InA'}
+
+    conn_list = MokuConnectionList.from_pairs(PAIRS)
+    conn_list.to_dict_list()[0]['source'] = 'Output1'
+    assert conn_list.to_pairs() == PAIRS
+    assert conn_list.to_dict_list()[0] == {'source': 'Input1', 'destination': 'Slot1InA'}
+
+
+def test_unchecked_skips_validation():
+    conn = MokuConnection.unchecked('Foo', 'Bar')
+    assert conn.to_dict() == {'source': 'Foo', 'destination': 'Bar'}
+
+
+@pytest.mark.parametrize('pair, message', [
+    ((' Foo ', 'Bar'), "Connection 0: Unknown port 'Foo'"),
+    (('Input1', ' '), "Connection 0: Port name cannot be empty"),
+])
+def test_from_pairs_rejects_bad_port(pair, message):
+    with pytest.raises(ValueError, match=message):
+        MokuConnectionList.from_pairs([pair])
+
+
+@pytest.mark.parametrize('source, message', [
+    ('Foo', "Unknown port 'Foo'"),
+    ('', "Port name cannot be empty"),
+])
+def test_from_dict_rejects_bad_port(source, message):
+    data = {'source': source, 'destination': 'Output1'}
+    with pytest.raises(ValueError, match=message):
+        MokuConnection.from_dict(data)
+    with pytest.raises(ValueError, match=f"Connection 1: {message}"):
+        MokuConnectionList.from_dict_list([{'source': 'Input1', 'destination': 'Slot1InA'}, data])
+
+
+def test_from_dict_strips_known_port():
+    conn = MokuConnection.from_dict({'source': ' Input1 ', 'destination': 'Slot1InA'})
+    assert conn == MokuConnection(source='Input1', destination='Slot1InA')
+    assert MokuConnectionList.from_dict_list([conn.to_dict()]).to_pairs() == PAIRS[:1]